@@ -1,25 +1,9 @@
 import os
 import copy
 import random
-import heapq
-from collections import deque
+from maze_file import MazeFile, is_binary_maze
 
-class Node:
-    def __init__(self, position, parent=None):
-        """
-        Initialize a node with its position and its parent node.
-        """
-        self.position = position
-        self.parent = parent
-        self.g = 0  # Cost from start node to this node
-        self.h = 0  # Heuristic (estimated cost from this node to goal)
-        self.f = 0  # Total cost (f = g + h)
-
-    def __lt__(self, other):
-        """
-        Compare two nodes based on their total cost.
-        """
-        return self.f < other.f
+START = 5  # Step stored for the start cell by the search, which has no previous cell
 
 
 class Solver:
@@ -28,77 +12,220 @@ class Solver:
         Initialize a solver with a maze file, a board, a wall character,
         a route character, a start position and a finish position.
         """
+        self.maze_file = None  # Binary MazeFile the maze was loaded from, kept open until the board is unpacked
+        self.lines = None  # Rows of the text file the maze was loaded from, kept until the board is unpacked
         self.board = []
         self.wall = '#'
         self.route = '.'
         self.start = (0, 0)
         self.finish = None  # Finish cell will be set during maze loading
+        self.rows = self.columns = 0  # Size of the board
+        self.path = None  # Path found by the last search
+        self.width = 0  # Row length of the padded flat grid
+        self.open_cells = bytearray()  # 1 for every cell that is not a wall, padded with a wall border
+        self.offsets = ()  # Flat index offsets of the four neighbors
+        self.expanded = 0  # Number of cells expanded by the last search
+        self.stats = None  # SolverStats to fill during the searches, if any
 
     def get_maze(self, file):
         """
-        Load the maze from a file and set the finish position.
+        Load the maze from a text or binary file and set the finish position.
+        """
+        if is_binary_maze(file):
+            maze_file = MazeFile(file)
+            self.board = None
+            self.maze_file = maze_file  # The board of characters is only unpacked if it is used
+            self.start = maze_file.start
+            self.load_grid(maze_file.open_rows(), maze_file.rows, maze_file.columns, maze_file.finish)
+        else:
+            with open(file, 'rb') as maze_file:
+                lines = maze_file.read().split()
+            self.board = None
+            self.lines = lines  # The board of characters is only unpacked if it is used
+            flags = self.open_flags()
+            self.load_grid((line.translate(flags) for line in lines), len(lines), len(lines[0]))
+
+    @property
+    def board(self):
+        """
+        The maze as a 2D array of characters. For a maze loaded from a file it is unpacked the first time
+        it is used, with the path of the last search marked on it.
+        """
+        if self._board is None and (self.maze_file is not None or self.lines is not None):
+            if self.maze_file is not None:
+                self._board = self.maze_file.board()
+                self.maze_file.close()
+                self.maze_file = None
+            else:
+                self._board = [list(line.decode()) for line in self.lines]
+                self.lines = None
+            for x, y in self.path or ():
+                self._board[x][y] = 'o'  # Mark path with 'o'
+        return self._board
+
+    @board.setter
+    def board(self, board):
+        self._board = board
+        self.maze_file = self.lines = None
+
+    def open_flags(self):
+        """
+        Get the translation table turning the characters of the maze into open cell flags, 0 for walls and 1 otherwise.
+        """
+        return bytes(byte != ord(self.wall) for byte in range(256))
+
+    def load_board(self, board, finish=None):
+        """
+        Load the maze from a 2D array of characters and set the finish position.
+        """
+        self.board = board
+        flags = self.open_flags()
+        self.load_grid(("".join(row).encode().translate(flags) for row in board), len(board), len(board[0]), finish)
+
+    def load_grid(self, rows, row_count, columns, finish=None):
+        """
+        Flatten rows of open cell flags (1 for an open cell, 0 for a wall) into a padded bitmap of open cells,
+        precompute the neighbor offsets and set the finish position (the last cell unless given).
+        """
+        width = columns + 2  # One wall column on each side
+        open_cells = bytearray(width * (row_count + 2))
+        for x, row in enumerate(rows):
+            start = (x + 1) * width + 1
+            open_cells[start:start + columns] = row
+        self.use_grid(open_cells, row_count, columns, finish)
+
+    def use_grid(self, open_cells, row_count, columns, finish=None):
+        """
+        Search a padded bitmap of open cells built by load_grid, or a read-only view on one (e.g. in shared memory),
+        without copying it, and set the finish position (the last cell unless given).
         """
-        with open(file, 'r') as maze_file:
-            self.board = [list(line.strip()) for line in maze_file]
-        # Set the finish cell to the last cell in the list
-        self.finish = (len(self.board) - 1, len(self.board[0]) - 1)
+        self.rows, self.columns = row_count, columns
+        self.finish = finish if finish is not None else (row_count - 1, columns - 1)
+        self.path = None
+        self.width = columns + 2
+        self.open_cells = open_cells
+        self.offsets = (self.width, -self.width, 1, -1)  # Down, up, right, left
+
+    def maze_rows(self):
+        """
+        Yield the rows of the maze as '.'/'#' bytes, read from the file while the board is not unpacked.
+        """
+        if self._board is None and self.maze_file is not None:
+            for x in range(self.rows):
+                yield self.maze_file.row(x)
+        elif self._board is None and self.lines is not None:
+            yield from self.lines
+        else:
+            for row in self._board:
+                yield "".join(row).encode()
+
+    def index(self, position):
+        """
+        Convert a (x, y) board position to its flat index.
+        """
+        return (position[0] + 1) * self.width + position[1] + 1
+
+    def position(self, index):
+        """
+        Convert a flat index back to its (x, y) board position.
+        """
+        x, y = divmod(index, self.width)
+        return x - 1, y - 1
 
     def astar_solver(self):
         """
         Solve the maze using the A* algorithm.
+        Every step costs 1 and changes the Manhattan distance to the finish by 1, so the f of a neighbor is
+        the f of its cell (step toward the finish) or 2 more. The open set is therefore two buckets,
+        the cells of the lowest f and those of the next one, instead of a heap, and the heuristic
+        comes from comparing the cell with the finish coordinates instead of dividing each index.
+        Cells are taken in increasing f and the heuristic is consistent, so the first time a cell is taken
+        its path is a shortest one: the only state kept per cell is the step it was reached by, one byte,
+        instead of a cost and a parent index, and a cell is queued again rather than having its cost lowered.
+        """
+        start, finish = self.index(self.start), self.index(self.finish)
+        size = len(self.open_cells)
+        steps = bytearray(size)  # 0 until a cell is expanded, then 1-4 for the offset it was reached by, START for the start
+        open_cells, width = self.open_cells, self.width
+        finish_column = finish % width
+        first_finish_row, last_finish_row = finish - finish_column, finish - finish_column + width - 1
+        track = self.stats is not None  # Counters are only kept when stats are requested
+        pops = max_frontier = 0
+        path = None
+        bucket, next_bucket = [start << 3 | START], []  # Entries are cell << 3 | step, lowest f and f + 2, popped last first
+        push, push_next = bucket.append, next_bucket.append
+        while bucket or next_bucket:
+            if not bucket:
+                bucket, next_bucket = next_bucket, bucket
+                push, push_next = push_next, push
+            if track:
+                pops += 1
+                max_frontier = max(max_frontier, len(bucket) + len(next_bucket))
+            entry = bucket.pop()
+            current = entry >> 3
+            if steps[current]:  # Stale entry, the cell was already reached by a path as short
+                continue
+            steps[current] = entry & 7
+            if current == finish:
+                path = self.reconstruct_path(current, steps)
+                break
+            # The four neighbors are written out, a loop over them would take twice as long
+            neighbor = current + width  # Down
+            if open_cells[neighbor] and not steps[neighbor]:
+                (push if current < first_finish_row else push_next)(neighbor << 3 | 1)
+            neighbor = current - width  # Up
+            if open_cells[neighbor] and not steps[neighbor]:
+                (push if current > last_finish_row else push_next)(neighbor << 3 | 2)
+            column = current % width
+            neighbor = current + 1  # Right
+            if open_cells[neighbor] and not steps[neighbor]:
+                (push if column < finish_column else push_next)(neighbor << 3 | 3)
+            neighbor = current - 1  # Left
+            if open_cells[neighbor] and not steps[neighbor]:
+                (push if column > finish_column else push_next)(neighbor << 3 | 4)
+        self.expanded = size - steps.count(0) - (path is not None)  # The finish is reached but not expanded
+        if track:
+            self.stats.expanded += self.expanded
+            self.stats.heap_pushes += pops + len(bucket) + len(next_bucket)  # Everything pushed was popped or is left
+            self.stats.heap_pops += pops
+            self.stats.stale_skipped += pops - self.expanded - (path is not None)  # The finish is popped but not expanded
+            self.stats.max_frontier = max(self.stats.max_frontier, max_frontier)
+        return path
+
+    def solve(self):
+        """
+        Solve the loaded maze and return the path, or None. Every solver has this entry point.
+        """
+        return self.astar_solver()
+
+    def get_neighbors(self, index):
+        """
+        Get the open neighboring cells of a cell.
+        """
+        open_cells = self.open_cells
+        return [index + offset for offset in self.offsets if open_cells[index + offset]]
+
+    def reconstruct_path(self, current, steps):
+        """
+        Reconstruct the path from the start cell to the current cell, stepping back along the offsets
+        the cells were reached by.
+        """
+        path = [self.position(current)]
+        while steps[current] != START:
+            current -= self.offsets[steps[current] - 1]
+            path.append(self.position(current))
+        path.reverse()
+        return self.mark_path(path)
+
+    def mark_path(self, path):
+        """
+        Keep the path of the last search and mark it with 'o' on the board, or once the board is unpacked.
         """
-        start_node = Node(self.start)
-        finish_node = Node(self.finish)
-        open_set = []
-        closed_set = set()
-        heapq.heappush(open_set, (0, start_node, start_node.position))
-        while open_set:
-            _, current_node, current_position = heapq.heappop(open_set)
-            if current_position == finish_node.position:
-                return self.reconstruct_path(current_node)
-            closed_set.add(current_position)
-            for neighbor in self.get_neighbors(current_node):
-                if neighbor.position in closed_set:
-                    continue
-                tentative_g = current_node.g + 1
-                if (neighbor, neighbor.position) not in open_set or tentative_g < neighbor.g:
-                    neighbor.g = tentative_g
-                    neighbor.h = self.heuristic(neighbor, finish_node)
-                    neighbor.f = neighbor.g + neighbor.h
-                    neighbor.parent = current_node
-                    heapq.heappush(open_set, (neighbor.f, neighbor, neighbor.position))
-        return None
-
-    def heuristic(self, node, finish_node):
-        """
-        Calculate the Manhattan distance heuristic between a node and the finish node.
-        """
-        return abs(node.position[0] - finish_node.position[0]) + abs(node.position[1] - finish_node.position[1])
-
-    def get_neighbors(self, node):
-        """
-        Get the neighboring nodes of a node.
-        """
-        neighbors = deque()
-        x, y = node.position
-        moves = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        for dx, dy in moves:
-            new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < len(self.board) and 0 <= new_y < len(self.board[0]) and self.board[new_x][new_y] != self.wall:
-                neighbors.append(Node((new_x, new_y), node))
-        return list(neighbors)
-
-    def reconstruct_path(self, current_node):
-        """
-        Reconstruct the path from the start node to the current node.
-        """
-        path = deque()
-        while current_node is not None:
-            x, y = current_node.position
-            self.board[x][y] = 'o'  # Mark path with 'o'
-            path.appendleft((x, y))
-            current_node = current_node.parent
-        return list(path)
+        self.path = path
+        if self._board is not None:
+            for x, y in path:
+                self._board[x][y] = 'o'  # Mark path with 'o'
+        return path
 
     def print_solution(self):
         """
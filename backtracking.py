@@ -1,111 +1,69 @@
 import random
-import cProfile
+from array import array
+from collections import deque
+from maze_core import Cell as GridCell, GridMaze
 
-class Cell:
-    def __init__(self, x, y):
-        """
-        Initialize a cell with its coordinates (x, y).
-        """
-        self.x = x
-        self.y = y
-        self.walls = {'N': True, 'E': True, 'S': True, 'W': True}  # Boolean values representing the presence of walls
-        self.visited = False  # Flag to track if the cell has been visited
 
-    def break_wall(self, direction, next_cell):
+class Cell(GridCell):
+    __slots__ = ()
+
+    @property
+    def visited(self):
         """
-        Break the wall between the current cell and the next cell in the given direction.
+        A cell has been visited by the generator once one of its walls has been broken.
         """
-        opposite_direction = {'N': 'S', 'E': 'W', 'S': 'N', 'W': 'E'}  # Mapping of opposite directions
-        self.walls[direction] = False
-        next_cell.walls[opposite_direction[direction]] = False
+        return self.grid.n == 1 or not all(self.walls.values())
 
 
-class Maze:
-    def __init__(self, name, n):
-        """
-        Initialize a maze with a name and size n x n.
-        """
-        self.name = name
-        self.n = n
-        self.board = [[Cell(x, y) for y in range(self.n)] for x in range(self.n)]  # 2D array of cells representing the maze
+class Maze(GridMaze):
+    cell_class = Cell
 
     def backtrack(self, current_cell):
         """
         Generate the maze using the backtrack algorithm.
         """
-        current_cell.visited = True
-        stack = [current_cell]  # Stack to store the visited cells
+        deque(self.backtrack_steps(current_cell), maxlen=0)  # Run every step, dropping the events
+
+    def backtrack_steps(self, current_cell):
+        """
+        Generate the maze using the backtrack algorithm one broken wall at a time.
+        Yield a ('break', x, y, direction) event after each wall is broken, from cell (x, y) toward direction.
+        """
+        n, height = self.n, self.height
+        visited = bytearray(n * height)  # Flags to track if a cell has been visited, only kept while generating
+        current = current_cell.x * n + current_cell.y
+        visited[current] = 1
+        stack = array('i', [current])  # Stack to store the visited cells
 
         while stack:
-            current_cell = stack[-1]
-            neighbors = self.check_neighbors(current_cell)  # Get the neighboring cells
-            unvisited_neighbors = [cell for cell in neighbors if not cell[0].visited]  # Filter unvisited neighbors
+            current = stack[-1]
+            x, y = divmod(current, n)
+            unvisited_neighbors = []
+            if x > 0 and not visited[current - n]:
+                unvisited_neighbors.append((current - n, 'N'))  # North neighbor
+            if x < height - 1 and not visited[current + n]:
+                unvisited_neighbors.append((current + n, 'S'))  # South neighbor
+            if y > 0 and not visited[current - 1]:
+                unvisited_neighbors.append((current - 1, 'W'))  # West neighbor
+            if y < n - 1 and not visited[current + 1]:
+                unvisited_neighbors.append((current + 1, 'E'))  # East neighbor
 
             if unvisited_neighbors:
                 next_cell, direction = random.choice(unvisited_neighbors)  # Choose a random unvisited neighbor
-                current_cell.break_wall(direction, next_cell)  # Break the wall between the current cell and the next cell
-                next_cell.visited = True
+                self.grid.break_wall(x, y, direction)  # Break the wall between the current cell and the next cell
+                visited[next_cell] = 1
                 stack.append(next_cell)
+                yield 'break', x, y, direction
             else:
                 stack.pop()
 
-    def check_neighbors(self, current_cell):
-        """
-        Get the neighboring cells of the current cell.
-        """
-        neighbors = []
-
-        if current_cell.x > 0:
-            neighbors.append((self.board[current_cell.x - 1][current_cell.y], 'N'))  # North neighbor
-        if current_cell.x < self.n - 1:
-            neighbors.append((self.board[current_cell.x + 1][current_cell.y], 'S'))  # South neighbor
-        if current_cell.y > 0:
-            neighbors.append((self.board[current_cell.x][current_cell.y - 1], 'W'))  # West neighbor
-        if current_cell.y < self.n - 1:
-            neighbors.append((self.board[current_cell.x][current_cell.y + 1], 'E'))  # East neighbor
-
-        return neighbors
-
-    def print_maze(self):
-        """
-        Generate a string representation of the maze.
-        """
-        maze_display = [["#" for _ in range(2 * self.n + 1)] for _ in range(2 * self.n + 1)]  # 2D array to represent the maze
-
-        for row in range(self.n):
-            for col in range(self.n):
-                maze_display[2 * row + 1][2 * col + 1] = "."  # Cells are represented by '.'
-                if self.board[row][col].visited:
-                    maze_display[2 * row + 1][2 * col + 1] = "."  # Mark visited cells with '.'
-                if self.board[row][col].walls['N']:
-                    maze_display[2 * row][2 * col + 1] = "#"  # North walls are represented by '#'
-                else:
-                    maze_display[2 * row][2 * col + 1] = "."  # No north wall
-                if self.board[row][col].walls['S']:
-                    maze_display[2 * row + 2][2 * col + 1] = "#"  # South walls are represented by '#'
-                else:
-                    maze_display[2 * row + 2][2 * col + 1] = "."  # No south wall
-                if self.board[row][col].walls['W']:
-                    maze_display[2 * row + 1][2 * col] = "#"  # West walls are represented by '#'
-                else:
-                    maze_display[2 * row + 1][2 * col] = "."  # No west wall
-                if self.board[row][col].walls['E']:
-                    maze_display[2 * row + 1][2 * col + 2] = "#"  # East walls are represented by '#'
-                else:
-                    maze_display[2 * row + 1][2 * col + 2] = "."  # No east wall
-
-        maze_display[0][0] = "."  # Start cell
-        maze_display[1][0] = "."  # Start cell
-        maze_display[2 * self.n][2 * self.n] = "."  # Finish cell
-        maze_display[2 * self.n - 1][2 * self.n] = "."  # Finish cell
-
-        maze_str = "\n".join(["".join(line) for line in maze_display])
-        return maze_str
-
-    def save_maze_to_txt(self, filename, content):
+    def save_maze_to_txt(self, filename, content=None):
         """
-        Save the maze to a text file.
+        Save the maze to a text file, rendering it straight to the file when no content is given.
         """
+        if content is None:
+            super().save_maze_to_txt(filename)
+            return
         with open(filename, 'w') as file:
             file.write(content)
 
@@ -114,7 +72,5 @@ if __name__ == "__main__":
     n = int(input("Enter the size of the maze: "))  # User input for maze size
     maze = Maze("maze", n)  # Create a maze object
     maze.backtrack(maze.board[0][0])  # Generate the maze starting from the top-left cell
-    maze_str = maze.print_maze()  # Generate the string representation of the maze
-    maze.save_maze_to_txt('maze.txt', maze_str)  # Save the maze to a text file
-
-    cProfile.run('maze.backtrack(maze.board[0][0])')  # Profile the backtrack algorithm
\ No newline at end of file
+    maze.save_maze_to_txt('maze.txt')  # Save the maze to a text file
+    maze.save_maze_to_binary('maze.bin')  # Save the maze to a binary file
@@ -2,6 +2,7 @@ import os
 import copy
 import random
 from collections import deque
+from maze_file import MazeFile, is_binary_maze
 
 
 class Solver:
@@ -14,22 +15,51 @@ class Solver:
         self.route = '.'  # Character representing a route in the maze
         self.start = (0, 0)  # Starting cell coordinates
         self.finish = None  # Finish cell coordinates (will be set during maze loading)
+        self.expanded = 0  # Number of cells visited by the last search
+        self.backtracks = 0  # Number of dead ends backed out of by the last search
+        self.max_stack = 0  # Largest stack size of the last search
+        self.stats = None  # SolverStats to fill during the searches, if any
 
     def get_maze(self, file_name):
         """
-        Load the maze from the given file.
+        Load the maze from the given text or binary file.
         """
+        if is_binary_maze(file_name):
+            with MazeFile(file_name) as maze_file:
+                self.start = maze_file.start
+                self.load_board(maze_file.board(), maze_file.finish)  # Unpack the binary maze into a 2D array
+            return
         with open(file_name, 'r') as file:
-            self.board = [list(line.strip()) for line in file]  # Read the maze from the file into a 2D array
-        self.finish = (len(self.board) - 1, len(self.board[0]) - 1)  # Set the finish cell coordinates to the last cell in the maze
+            self.load_board([list(line.strip()) for line in file])  # Read the maze from the file into a 2D array
+
+    def load_board(self, board, finish=None):
+        """
+        Load the maze from a 2D array of characters.
+        """
+        self.board = board
+        if finish is None:
+            finish = (len(self.board) - 1, len(self.board[0]) - 1)  # Default to the last cell in the maze
+        self.finish = finish
 
     def backtracking_solver(self):
         """
         Solve the maze using the backtracking algorithm.
         """
+        deque(self.backtracking_steps(), maxlen=0)  # Run every step, dropping the events
+
+    def backtracking_steps(self):
+        """
+        Solve the maze using the backtracking algorithm one move at a time.
+        Yield an ('expand', x, y) event when the cell (x, y) is visited and ('dead_end', x, y) when it is left
+        as a dead end. The stats are only filled once every step has run.
+        """
         self.current_cell = self.start  # Start from the starting cell
         self.board[self.current_cell[0]][self.current_cell[1]] = "o"  # Mark the starting cell as visited
+        yield 'expand', *self.current_cell
         self.stack = deque()  # Stack to store the visited cells
+        self.expanded = 1
+        self.backtracks = 0
+        self.max_stack = 0
         while self.current_cell != self.finish:  # Continue until the finish cell is reached
             neighbors = []  # List to store the neighboring cells
             # Check left neighbor
@@ -60,15 +90,39 @@ class Solver:
                 random.shuffle(neighbors)  # Randomize the order of the neighbors
                 next_cell = neighbors[0]  # Choose the first neighbor
                 self.stack.append(self.current_cell)  # Push the current cell to the stack
+                self.max_stack = max(self.max_stack, len(self.stack))
                 self.current_cell = next_cell  # Move to the next cell
                 self.board[self.current_cell[0]][self.current_cell[1]] = "o"  # Mark the current cell as visited
+                self.expanded += 1
+                yield 'expand', *self.current_cell
             else:  # If there are no neighboring cells
                 if not self.stack:  # If the stack is empty
                     print("No Solution")  # Maze has no solution
                     break
                 else:
                     self.board[self.current_cell[0]][self.current_cell[1]] = "*"  # Mark the current cell as a dead end
+                    yield 'dead_end', *self.current_cell
                     self.current_cell = self.stack.pop()  # Backtrack to the previous cell
+                    self.backtracks += 1
+        if self.stats is not None:
+            self.stats.expanded += self.expanded
+            self.stats.backtracks += self.backtracks
+            self.stats.max_frontier = max(self.stats.max_frontier, self.max_stack)
+
+    def solve(self):
+        """
+        Solve the loaded maze and return the path, or None. Every solver has this entry point.
+        """
+        self.backtracking_solver()
+        return self.solution_path()
+
+    def solution_path(self):
+        """
+        Get the path from the start to the finish held by the stack after a solve, or None if the finish was not reached.
+        """
+        if self.current_cell != self.finish:
+            return None
+        return list(self.stack) + [self.current_cell]
 
     def print_solution(self):
         """
@@ -0,0 +1,109 @@
+import os
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from backtracking import Maze as BacktrackingMaze
+from kruskal import Maze as KruskalMaze
+from eller import Maze as EllerMaze
+from binary_tree import Maze as BinaryTreeMaze
+from sidewinder import Maze as SidewinderMaze
+from wilson import Maze as WilsonMaze
+from astar import Solver as AStarSolver
+from backtracking_solver import Solver as BacktrackingSolver
+from deadend_solver import Solver as DeadEndSolver
+from bitboard_solver import Solver as BitboardSolver
+from bidirectional_solver import Solver as BidirectionalSolver
+from run import save_solution
+from cache import find_dead_ends
+
+GENERATORS = ('backtracking', 'kruskal', 'eller', 'binary_tree', 'sidewinder', 'wilson')
+SOLVERS = {'astar': AStarSolver, 'backtracking': BacktrackingSolver, 'deadend': DeadEndSolver,
+           'bitboard': BitboardSolver, 'bidirectional': BidirectionalSolver}  # Solver class of each algorithm
+
+
+def generate_rows(algorithm, n):
+    """
+    Generate a maze in memory using the specified algorithm and return its rows of characters.
+    """
+    if algorithm == 'eller':
+        return [line.decode() for line in EllerMaze("maze", n).eller()]
+    if algorithm == 'backtracking':
+        maze = BacktrackingMaze("maze", n)
+        maze.backtrack(maze.board[0][0])
+    elif algorithm == 'binary_tree':
+        maze = BinaryTreeMaze("maze", n)
+        maze.binary_tree()
+    elif algorithm == 'sidewinder':
+        maze = SidewinderMaze("maze", n)
+        maze.sidewinder()
+    elif algorithm == 'wilson':
+        maze = WilsonMaze("maze", n)
+        maze.wilson()
+    else:
+        maze = KruskalMaze("maze", n)
+        maze.kruskal()
+    return maze.print_maze().split("\n")
+
+
+def solve_rows(algorithm, rows):
+    """
+    Solve a maze given as rows of characters using the specified algorithm.
+    Return the solver and the path found, or None.
+    """
+    solver = SOLVERS[algorithm]()
+    solver.load_board([list(row) for row in rows])
+    return solver, solver.solve()
+
+
+def run_task(task):
+    """
+    Generate, solve and save one maze. Everything stays in memory until the solution is written.
+    """
+    generator, solver_name, n, seed, output_dir, save_image, compact, compress = task
+    random.seed(seed)  # Each task owns its process-wide random state while it runs
+    rows = generate_rows(generator, n)
+    solver, path = solve_rows(solver_name, rows)
+    name = f"{n}_{generator}maze_{solver_name}_{seed}"
+    folder_path = os.path.join(output_dir, name)
+    os.makedirs(folder_path, exist_ok=True)
+    solution = {'start': solver.start, 'path': path, 'dead_ends': find_dead_ends(solver.board)} if compact else None
+    save_solution(folder_path, name + ".txt", rows, solver.board, save_image=save_image, solution=solution,
+                  compress=compress)
+    return name
+
+
+def run_batch(generator, solver, n, count, seed=0, workers=None, output_dir="solved_mazes", save_image=True,
+              compact=False, compress=False):
+    """
+    Generate and solve count mazes over a pool of worker processes.
+    Maze i uses the seed seed + i. Return the number of mazes per second.
+    """
+    tasks = [(generator, solver, n, seed + i, output_dir, save_image, compact, compress) for i in range(count)]
+    workers = workers or os.cpu_count()
+    chunk_size = max(1, count // (workers * 4))  # Large enough to amortize inter-process traffic
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(run_task, tasks, chunksize=chunk_size):
+            pass
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed else float('inf')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate and solve mazes in batch.")
+    parser.add_argument("--generator", choices=GENERATORS, default='backtracking', help="maze generation algorithm")
+    parser.add_argument("--solver", choices=SOLVERS, default='astar', help="maze solving algorithm")
+    parser.add_argument("--size", type=int, required=True, help="size n of the n x n mazes")
+    parser.add_argument("--count", type=int, default=1, help="number of mazes to generate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first maze, the next ones use seed + 1, seed + 2, ...")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: all cores)")
+    parser.add_argument("--output", default="solved_mazes", help="directory to store the maze solutions")
+    parser.add_argument("--no-image", action="store_true", help="skip the png of each solution")
+    parser.add_argument("--compact", action="store_true", help="save the maze once with its moves and dead ends")
+    parser.add_argument("--gzip", action="store_true", help="gzip-compress the compact solutions")
+    args = parser.parse_args()
+
+    throughput = run_batch(args.generator, args.solver, args.size, args.count, args.seed,
+                           args.workers, args.output, not args.no_image, args.compact, args.gzip)
+    print(f"{args.count} mazes solved ({throughput:.1f} mazes/sec)")
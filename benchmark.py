@@ -0,0 +1,218 @@
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+from backtracking import Maze as BacktrackingMaze
+from kruskal import Maze as KruskalMaze
+from astar import Solver as AStarSolver
+from backtracking_solver import Solver as BacktrackingSolver
+from deadend_solver import Solver as DeadEndSolver
+from run import create_colored_maze_image
+
+DEFAULT_SIZES = (25, 100, 250, 1000, 2000)
+DEFAULT_REPEAT = 5  # Timed runs per benchmark, the best one is kept
+# Growth always allowed on top of the tolerance ratio, so that short runs can not fail on noise alone
+TIME_FLOOR = 0.01  # Seconds
+MEMORY_FLOOR = 64 * 1024  # Bytes
+
+
+def kruskal_rows(n, seed):
+    """
+    Generate the Kruskal maze used as input by the solver and renderer benchmarks.
+    """
+    random.seed(seed)
+    maze = KruskalMaze("maze", n)
+    maze.kruskal()
+    return maze, maze.print_maze().split("\n")
+
+
+def setup_backtrack(n, seed):
+    random.seed(seed)
+    return BacktrackingMaze("maze", n)
+
+
+def run_backtrack(maze):
+    maze.backtrack(maze.board[0][0])
+
+
+def setup_kruskal(n, seed):
+    random.seed(seed)
+    return KruskalMaze("maze", n)
+
+
+def run_kruskal(maze):
+    maze.kruskal()
+
+
+def setup_print_maze(n, seed):
+    return kruskal_rows(n, seed)[0]
+
+
+def run_print_maze(maze):
+    maze.print_maze()
+
+
+def setup_astar(n, seed):
+    solver = AStarSolver()
+    solver.load_board([list(row) for row in kruskal_rows(n, seed)[1]])
+    return solver
+
+
+def setup_backtracking_solver(n, seed):
+    solver = BacktrackingSolver()
+    solver.load_board([list(row) for row in kruskal_rows(n, seed)[1]])
+    random.seed(seed)
+    return solver
+
+
+def setup_dead_end_filling(n, seed):
+    solver = DeadEndSolver()
+    solver.load_board([list(row) for row in kruskal_rows(n, seed)[1]])
+    return solver
+
+
+def run_solver(solver):
+    solver.solve()
+    return solver.expanded
+
+
+def setup_image(n, seed):
+    solver = setup_astar(n, seed)
+    solver.solve()
+    return solver.board
+
+
+def run_image(board):
+    create_colored_maze_image(board)
+
+
+# Name of each benchmark with the function building a fresh input and the function being measured
+BENCHMARKS = {
+    'backtracking.Maze.backtrack': (setup_backtrack, run_backtrack),
+    'kruskal.Maze.kruskal': (setup_kruskal, run_kruskal),
+    'Maze.print_maze': (setup_print_maze, run_print_maze),
+    'astar.Solver.astar_solver': (setup_astar, run_solver),
+    'backtracking_solver.Solver.backtracking_solver': (setup_backtracking_solver, run_solver),
+    'deadend_solver.Solver.dead_end_filling': (setup_dead_end_filling, run_solver),
+    'run.create_colored_maze_image': (setup_image, run_image),
+}
+
+
+def time_run(setup, run, n, seed):
+    """
+    Measure the wall time of one run with the garbage collector off, like timeit, and return it with
+    the number of expanded nodes. The run gets a fresh input from setup, which is not measured.
+    """
+    state = setup(n, seed)
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        expanded = run(state)
+        return time.perf_counter() - start, expanded
+    finally:
+        gc.enable()
+
+
+def measure_memory(setup, run, n, seed):
+    """
+    Measure the peak memory of one run under tracemalloc.
+    """
+    state = setup(n, seed)
+    tracemalloc.start()
+    run(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(sizes, names, seed=0, repeat=DEFAULT_REPEAT):
+    """
+    Run the selected benchmarks over every size and return the results keyed by benchmark name then size.
+    The timed runs go in repeat rounds over every benchmark rather than back to back, so that the runs
+    of a benchmark are spread over the whole session and a slow spell of the machine does not hit them all.
+    The best time of each benchmark is kept, then its peak memory is measured in one more run.
+    """
+    cases = [(name, n) for name in names for n in sizes]
+    times, expanded = {}, {}
+    for _ in range(repeat):
+        for name, n in cases:
+            elapsed, expanded[name, n] = time_run(*BENCHMARKS[name], n, seed)
+            times[name, n] = min(times.get((name, n), elapsed), elapsed)
+    results = {}
+    for name, n in cases:
+        result = {'time': times[name, n], 'peak_memory': measure_memory(*BENCHMARKS[name], n, seed),
+                  'nodes_expanded': expanded[name, n]}
+        results.setdefault(name, {})[str(n)] = result
+        print(f"{name} n={n}: {result}", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, tolerance, time_floor=TIME_FLOOR, memory_floor=MEMORY_FLOOR):
+    """
+    Compare the results with a baseline and return the list of regressions.
+    Time and peak memory may grow by the tolerance ratio plus an absolute floor (seconds, bytes),
+    the number of expanded nodes may not grow at all.
+    """
+    floors = {'time': time_floor, 'peak_memory': memory_floor}
+    regressions = []
+    for name, by_size in results.items():
+        for n, current in by_size.items():
+            previous = baseline.get(name, {}).get(n)
+            if previous is None:
+                continue
+            for metric in ('time', 'peak_memory'):
+                if current[metric] > previous[metric] * (1 + tolerance) + floors[metric]:
+                    regressions.append(f"{name} n={n}: {metric} {previous[metric]:.4g} -> {current[metric]:.4g}")
+            if (current['nodes_expanded'] is not None and previous['nodes_expanded'] is not None
+                    and current['nodes_expanded'] > previous['nodes_expanded']):
+                regressions.append(f"{name} n={n}: nodes_expanded {previous['nodes_expanded']} -> {current['nodes_expanded']}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the maze generators, solvers and renderers.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma separated maze sizes")
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS), help="benchmark to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed used to generate every maze")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per benchmark, the best one is kept")
+    parser.add_argument("--output", default="benchmark_results.json", help="file to store the results")
+    parser.add_argument("--baseline", default="benchmark_baseline.json", help="baseline to compare the results with")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown/memory growth ratio")
+    parser.add_argument("--time-floor", type=float, default=TIME_FLOOR, help="slowdown in seconds always allowed")
+    parser.add_argument("--memory-floor", type=int, default=MEMORY_FLOOR, help="memory growth in bytes always allowed")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run_benchmarks(sizes, args.only or list(BENCHMARKS), args.seed, args.repeat)
+    report = {'python': platform.python_version(), 'platform': platform.platform(), 'machine': platform.machine(),
+              'seed': args.seed, 'results': results}
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print("Baseline saved to", args.baseline)
+        sys.exit(0)
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        sys.exit(f"No baseline found at {args.baseline}, run with --save-baseline to create one")
+    if baseline.get('seed') != args.seed:
+        sys.exit(f"Baseline was recorded with seed {baseline.get('seed')}, not {args.seed}")
+    if (baseline.get('platform'), baseline.get('python')) != (report['platform'], report['python']):
+        print(f"Warning: baseline was recorded with Python {baseline.get('python')} on {baseline.get('platform')}, "
+              f"times and memory may not be comparable", file=sys.stderr)
+    regressions = compare(results, baseline['results'], args.tolerance, args.time_floor, args.memory_floor)
+    if regressions:
+        print("PERFORMANCE REGRESSIONS:")
+        for regression in regressions:
+            print("  " + regression)
+        sys.exit(1)
+    print("No regression against", args.baseline)
@@ -0,0 +1,68 @@
+from array import array
+from astar import Solver as AStarSolver
+
+
+class Solver(AStarSolver):
+    def solve(self):
+        """
+        Solve the loaded maze and return the path, or None.
+        """
+        return self.bidirectional_solver()
+
+    def bidirectional_solver(self):
+        """
+        Solve the maze with two breadth-first searches, one from the start and one from the finish,
+        always growing the smaller frontier by a whole layer, until the frontiers meet.
+        Return the shortest path like astar.Solver.astar_solver, or None.
+        """
+        start, finish = self.index(self.start), self.index(self.finish)
+        size = len(self.open_cells)
+        side = bytearray(size)  # 1 for cells reached from the start, 2 from the finish
+        distance = array('i', [-1]) * size  # Distance to the start or to the finish, depending on the side
+        parents = array('i', [-1]) * size  # Previous cell toward the start or the finish
+        open_cells, offsets = self.open_cells, self.offsets
+        frontiers = {1: [start], 2: [finish]}
+        side[start], side[finish] = 1, 2
+        distance[start] = distance[finish] = 0
+        best = None  # (path length, cell of the growing side, cell of the other side)
+        max_frontier = 1
+        if start == finish:
+            best = (0, start, finish)
+        while best is None and frontiers[1] and frontiers[2]:
+            grow = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+            layer = []
+            for current in frontiers[grow]:
+                for offset in offsets:
+                    neighbor = current + offset
+                    if not open_cells[neighbor]:
+                        continue
+                    if not side[neighbor]:
+                        side[neighbor] = grow
+                        distance[neighbor] = distance[current] + 1
+                        parents[neighbor] = current
+                        layer.append(neighbor)
+                    elif side[neighbor] != grow:  # The frontiers meet, keep the shortest junction of the layer
+                        length = distance[current] + 1 + distance[neighbor]
+                        if best is None or length < best[0]:
+                            best = (length, current, neighbor)
+            frontiers[grow] = layer
+            max_frontier = max(max_frontier, len(frontiers[1]) + len(frontiers[2]))
+        self.expanded = size - side.count(0)
+        if self.stats is not None:
+            self.stats.expanded += self.expanded
+            self.stats.max_frontier = max(self.stats.max_frontier, max_frontier)
+        if best is None:
+            return None
+        _, first, second = best
+        if side[first] == 2:
+            first, second = second, first  # first is now on the start side
+        path = []
+        while first != -1:
+            path.append(first)
+            first = parents[first]
+        path.reverse()
+        if second != path[-1]:
+            while second != -1:
+                path.append(second)
+                second = parents[second]
+        return self.mark_path([self.position(index) for index in path])
@@ -0,0 +1,27 @@
+import random
+import numpy as np
+from maze_core import GridMaze
+from grid_bands import band_rows, carve_rows
+
+
+class Maze(GridMaze):
+    def binary_tree(self, seed=None):
+        """
+        Generate the maze using the binary tree algorithm: every cell opens either its east or its south passage
+        at random, except on the last row (always east) and the last column (always south).
+        Bands of rows are drawn at once from a numpy.random.Generator seeded with seed (drawn from random if None).
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed  # Stored in the binary maze file
+        rng = np.random.default_rng(self.seed)
+        n, height = self.n, self.height
+        step = band_rows(n)
+        for first in range(0, height, step):
+            rows = min(step, height - first)
+            east = rng.random((rows, n)) < 0.5
+            east[:, -1] = False  # Outer east wall
+            south = ~east
+            south[:, -1] = True
+            if first + rows == height:  # The last row only goes east
+                east[-1, :-1] = True
+                south[-1] = False
+            carve_rows(self.grid, first, east, south)
@@ -0,0 +1,106 @@
+from backtracking_solver import Solver as BacktrackingSolver
+
+
+class Solver(BacktrackingSolver):
+    def __init__(self):
+        """
+        Initialize the Solver object, mazes are loaded and printed like with the backtracking solver.
+        """
+        super().__init__()
+        self.width = 0  # Bits per board row, one more than the row length
+        self.open_cells = 0  # Bitboard of the open cells
+        self.layers = 0  # Number of breadth-first layers of the last search
+
+    def solve(self):
+        """
+        Solve the loaded maze and return the path, or None.
+        """
+        return self.bitboard_solver()
+
+    def build_bitboard(self):
+        """
+        Pack the open cells of the board into one integer: cell (x, y) is bit x * width + y.
+        Every row ends with an extra closed bit so that shifting by one never wraps to the next row.
+        """
+        self.width = len(self.board[0]) + 1
+        to_bits = str.maketrans({character: '1' for character in ".o*"} | {self.wall: '0'})
+        # Most significant bit first: last row first, each row reversed after its closing bit
+        bits = "".join("0" + "".join(row).translate(to_bits)[::-1] for row in reversed(self.board))
+        self.open_cells = int(bits, 2)
+
+    def expand(self, frontier, previous):
+        """
+        Get the open cells next to any cell of the frontier that are not in the previous layer,
+        in a few operations over the whole grid. The grid is bipartite, so this is the next layer.
+        """
+        width = self.width
+        # previous only holds open cells, so open ^ previous is open & ~previous without a negative integer
+        return ((frontier << 1) | (frontier >> 1) | (frontier << width) | (frontier >> width)) & (self.open_cells ^ previous)
+
+    def bit(self, position):
+        """
+        Get the bit number of a (x, y) board position.
+        """
+        return position[0] * self.width + position[1]
+
+    def bitboard_distance(self):
+        """
+        Get the length of the shortest path from start to finish, or None if the finish cannot be reached.
+        """
+        self.build_bitboard()
+        finish = 1 << self.bit(self.finish)
+        previous, frontier = 0, (1 << self.bit(self.start)) & self.open_cells
+        self.layers = 0
+        while frontier and not frontier & finish:
+            previous, frontier = frontier, self.expand(frontier, previous)
+            self.layers += 1
+        return self.layers if frontier else None
+
+    def bitboard_solver(self):
+        """
+        Solve the maze with a breadth-first search over bitboards and mark the shortest path with 'o'.
+        No layer is kept: the reached cells are only split into two bitboards by bit 1 of their distance.
+        Open neighbors are one step closer or further (the grid is bipartite) and the distances d - 1 and d + 1
+        differ in that bit, so walking back from the finish each step goes to the neighbor in the right bitboard.
+        Return the path like astar.Solver.astar_solver, or None.
+        """
+        self.build_bitboard()
+        finish = 1 << self.bit(self.finish)
+        previous, frontier = 0, (1 << self.bit(self.start)) & self.open_cells
+        halves = [frontier, 0]  # Reached cells whose distance has bit 1 clear, set
+        track = self.stats is not None  # Layer sizes are only counted when stats are requested
+        max_frontier = 1
+        layer = 0
+        while frontier and not frontier & finish:
+            previous, frontier = frontier, self.expand(frontier, previous)
+            layer += 1
+            halves[layer >> 1 & 1] |= frontier
+            if track:
+                max_frontier = max(max_frontier, frontier.bit_count())
+        self.layers = layer
+        self.expanded = halves[0].bit_count() + halves[1].bit_count()  # Cells reached
+        if track:
+            self.stats.expanded += self.expanded
+            self.stats.layers += layer
+            self.stats.max_frontier = max(self.stats.max_frontier, max_frontier)
+        if not frontier:
+            return None
+
+        size = (self.open_cells.bit_length() + 7) // 8
+        halves = [half.to_bytes(size, 'little') for half in halves]  # Bytes for constant time bit tests
+        width = self.width
+        cell = self.bit(self.finish)
+        path = [cell]
+        for current in range(layer, 0, -1):
+            cells = halves[(current - 1) >> 1 & 1]
+            for neighbor in (cell - 1, cell + 1, cell - width, cell + width):
+                if 0 <= neighbor < size * 8 and cells[neighbor >> 3] >> (neighbor & 7) & 1:
+                    break
+            cell = neighbor
+            path.append(cell)
+
+        path.reverse()
+        positions = [divmod(cell, width) for cell in path]
+        for x, y in positions:
+            self.board[x][y] = 'o'  # Mark path with 'o'
+        return positions
@@ -0,0 +1,127 @@
+import os
+import json
+import hashlib
+from itertools import accumulate
+from collections import OrderedDict
+from moves import encode_moves, decode_moves, gaps
+
+CACHE_DIR = os.path.join("solved_mazes", ".cache")
+
+
+def mark_solution(board, path, dead_ends):
+    """
+    Mark the path with 'o' and the dead ends (flat cell indices) with '*' on the board.
+    """
+    width = len(board[0])
+    for index in dead_ends:
+        board[index // width][index % width] = '*'
+    for x, y in path:
+        board[x][y] = 'o'
+
+
+def find_dead_ends(board):
+    """
+    List the flat indices of the cells marked as dead ends on a solved board.
+    """
+    width = len(board[0])
+    return [x * width + y for x, row in enumerate(board) for y, cell in enumerate(row) if cell == '*']
+
+
+class SolutionCache:
+    def __init__(self, directory=CACHE_DIR, max_memory_bytes=4 * 1024 * 1024, max_disk_bytes=64 * 1024 * 1024):
+        """
+        Initialize a solution cache kept in memory (at most max_memory_bytes of encoded solutions)
+        and on disk in the directory (at most max_disk_bytes), both evicting the least recently used first.
+        """
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()  # Key -> encoded solution, the bytes of its file, most recently used last
+        self.memory_bytes = 0  # Total size of the encoded solutions in memory
+
+    def key(self, board, solver_name, start, finish):
+        """
+        Build the cache key of a maze board (rows of characters, or of '.'/'#' bytes) solved by the given solver
+        between start and finish.
+        """
+        digest = hashlib.sha256()
+        for row in board:
+            digest.update(row if isinstance(row, bytes) else "".join(row).encode())
+            digest.update(b"\n")
+        digest.update(f"{solver_name}:{start}:{finish}".encode())
+        return digest.hexdigest()
+
+    def encode(self, path, dead_ends):
+        """
+        Encode a solution as JSON bytes: the path as run-length moves, the dead ends as the gaps between them.
+        """
+        return json.dumps({'start': path[0], 'moves': encode_moves(path), 'dead_end_gaps': list(gaps(dead_ends))}).encode()
+
+    def decode(self, data):
+        """
+        Decode the JSON bytes of a solution into a dict with 'path' and 'dead_ends'.
+        """
+        stored = json.loads(data)
+        return {'path': decode_moves(stored['start'], stored['moves']),
+                'dead_ends': list(accumulate(stored['dead_end_gaps']))}
+
+    def get(self, key):
+        """
+        Get the cached solution for the key as a dict with 'path' and 'dead_ends', or None.
+        A file that cannot be decoded (truncated, corrupt or from an older format) is a miss and is deleted.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.decode(self.entries[key])
+        file_path = os.path.join(self.directory, key + ".json")
+        try:
+            with open(file_path, 'rb') as file:
+                data = file.read()
+            solution = self.decode(data)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):  # json.JSONDecodeError is a ValueError
+            os.remove(file_path)
+            return None
+        os.utime(file_path)  # Mark the file as recently used
+        self.remember(key, data)
+        return solution
+
+    def put(self, key, path, dead_ends=()):
+        """
+        Store a solution path and its dead ends in memory and on disk.
+        """
+        data = self.encode(path, dead_ends)
+        os.makedirs(self.directory, exist_ok=True)
+        file_path = os.path.join(self.directory, key + ".json")
+        with open(file_path + ".tmp", 'wb') as file:
+            file.write(data)
+        os.replace(file_path + ".tmp", file_path)  # Readers never see a partly written file
+        self.remember(key, data)
+        self.evict_disk()
+
+    def remember(self, key, data):
+        """
+        Keep an encoded solution in memory, evicting the least recently used ones over max_memory_bytes.
+        """
+        if key in self.entries:
+            self.memory_bytes -= len(self.entries.pop(key))
+        if len(data) > self.max_memory_bytes:  # Too large to keep, it stays on disk only
+            return
+        self.entries[key] = data
+        self.memory_bytes += len(data)
+        while self.memory_bytes > self.max_memory_bytes:
+            self.memory_bytes -= len(self.entries.popitem(last=False)[1])
+
+    def evict_disk(self):
+        """
+        Delete the least recently used files until the cache directory fits in max_disk_bytes.
+        """
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in files)
+        for entry in files:
+            if total <= self.max_disk_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
@@ -0,0 +1,97 @@
+import numpy as np
+from backtracking_solver import Solver as BacktrackingSolver
+
+
+class Solver(BacktrackingSolver):
+    def __init__(self):
+        """
+        Initialize the Solver object, mazes are loaded and printed like with the backtracking solver.
+        """
+        super().__init__()
+        self.passes = 0  # Number of filling passes of the last solve
+
+    def solve(self):
+        """
+        Solve the loaded maze and return the path, or None.
+        """
+        return self.dead_end_filling()
+
+    def dead_end_filling(self):
+        """
+        Solve a perfect maze by filling its dead ends until only the path from start to finish is left.
+        Return the path like astar.Solver.astar_solver. Raise ValueError if the maze has a loop.
+        Cells are handled as whole arrays: the first pass finds every dead end of the maze at once,
+        the following ones only look at the neighbors of the cells filled by the previous pass.
+        """
+        rows, columns = len(self.board), len(self.board[0])
+        width = columns + 2  # One wall column on each side
+        characters = np.frombuffer("".join(map("".join, self.board)).encode(), dtype=np.uint8).reshape(rows, columns)
+        grid = np.zeros((rows + 2, columns + 2), dtype=bool)
+        grid[1:-1, 1:-1] = characters != ord(self.wall)
+        degree = np.zeros(grid.shape, dtype=np.int8)  # Number of open neighbors of each cell
+        degree[1:-1, 1:-1] = (grid[:-2, 1:-1].astype(np.int8) + grid[2:, 1:-1] + grid[1:-1, :-2] + grid[1:-1, 2:])
+        protected = np.zeros(grid.shape, dtype=bool)  # The start and finish are never filled
+        protected[self.start[0] + 1, self.start[1] + 1] = protected[self.finish[0] + 1, self.finish[1] + 1] = True
+        open_cells, degree, protected = grid.ravel(), degree.ravel(), protected.ravel()
+        was_open = open_cells.copy()
+        offsets = np.array([width, -width, 1, -1])
+
+        dead_ends = np.flatnonzero(open_cells & (degree <= 1) & ~protected)
+        self.passes = 0
+        while dead_ends.size:
+            self.passes += 1
+            if dead_ends.size == 1:  # A single branch left to fill is a corridor, no need for arrays
+                self.fill_corridor(int(dead_ends[0]), open_cells, degree, protected, (width, -width, 1, -1))
+                break
+            open_cells[dead_ends] = False
+            neighbors = (dead_ends[:, None] + offsets).ravel()
+            neighbors = neighbors[open_cells[neighbors]]  # The open neighbor of each dead end, if any
+            np.subtract.at(degree, neighbors, 1)  # A cell next to two dead ends loses two neighbors
+            dead_ends = neighbors[(degree[neighbors] <= 1) & ~protected[neighbors]]
+            if dead_ends.size > 1:
+                dead_ends = np.unique(dead_ends)
+        filled = was_open & ~open_cells
+
+        self.expanded = int(filled.sum())
+        if self.stats is not None:
+            self.stats.expanded += self.expanded
+        marks = np.where(grid, ord('o'), ord(self.wall)).astype(np.uint8)  # What is left open is the path
+        marks[filled.reshape(grid.shape)] = ord('*')  # Filled cells are marked as dead ends
+        self.board = [list(row.tobytes().decode()) for row in marks[1:-1, 1:-1]]
+        return self.solution_path()
+
+    def solution_path(self):
+        """
+        Walk the cells left open from the start to the finish. Return the path, or None if they are not connected.
+        Filling never removes a loop, so raise ValueError when the walk can go two ways, like TreeIndex.build.
+        """
+        path = [self.start]
+        previous = None
+        while path[-1] != self.finish:
+            x, y = path[-1]
+            next_cells = [next_cell for next_cell in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+                          if next_cell != previous and 0 <= next_cell[0] < len(self.board)
+                          and 0 <= next_cell[1] < len(self.board[0]) and self.board[next_cell[0]][next_cell[1]] == 'o']
+            if not next_cells:
+                return None
+            if len(next_cells) > 1:
+                raise ValueError("The maze has a loop, it is not a perfect maze")
+            previous = path[-1]
+            path.append(next_cells[0])
+        return path
+
+    def fill_corridor(self, dead_end, open_cells, degree, protected, offsets):
+        """
+        Fill a single dead end and keep following its corridor while the next cell becomes a dead end too.
+        """
+        while True:
+            open_cells[dead_end] = False
+            for offset in offsets:
+                if open_cells[dead_end + offset]:
+                    break
+            else:
+                return  # Nothing left around the cell
+            dead_end += offset
+            degree[dead_end] -= 1
+            if degree[dead_end] > 1 or protected[dead_end]:
+                return
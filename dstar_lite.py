@@ -0,0 +1,136 @@
+import heapq
+from array import array
+
+INFINITY = 1 << 30  # Cost of unreachable cells, small enough for array('i') once incremented
+
+
+class Planner:
+    def __init__(self, solver):
+        """
+        Plan shortest paths on the maze loaded in an astar.Solver with D* Lite.
+        The search runs backward from the finish, so after walls are opened or closed with set_wall,
+        only the cells whose distance to the finish changed are searched again.
+        """
+        self.solver = solver
+        size = len(solver.open_cells)
+        self.start, self.goal = solver.index(solver.start), solver.index(solver.finish)
+        self.start_x, self.start_y = divmod(self.start, solver.width)
+        self.g = array('i', [INFINITY]) * size  # Distance to the finish as of the last expansion of each cell
+        self.rhs = array('i', [INFINITY]) * size  # One step more than the best neighbor distance
+        self.queue = []  # Entries are (key, tiebreak, index), stale entries are skipped
+        self.queued = {}  # Index of the inconsistent cells -> their key in the queue
+        self.expanded = 0  # Number of cells expanded by the last repair
+        self.update_cell(self.goal)
+        self.compute_shortest_path()
+
+    def heuristic(self, index):
+        """
+        Calculate the Manhattan distance between a cell and the start, the search goes toward it.
+        """
+        x, y = divmod(index, self.solver.width)
+        return abs(x - self.start_x) + abs(y - self.start_y)
+
+    def key(self, index):
+        """
+        Get the priority of a cell: lowest possible path length through it, then distance to the finish.
+        """
+        best = min(self.g[index], self.rhs[index])
+        return (best + self.heuristic(index) if best < INFINITY else INFINITY), best
+
+    def update_cell(self, index):
+        """
+        Recompute the rhs value of a cell from its open neighbors and queue it while it is inconsistent.
+        """
+        open_cells, g = self.solver.open_cells, self.g
+        if not open_cells[index]:
+            best = INFINITY
+        elif index == self.goal:
+            best = 0
+        else:
+            best = INFINITY
+            for offset in self.solver.offsets:
+                neighbor = index + offset
+                if open_cells[neighbor] and g[neighbor] < best:
+                    best = g[neighbor]
+            best = min(best + 1, INFINITY)
+        self.rhs[index] = best
+        if g[index] != best:
+            key = self.key(index)
+            self.queued[index] = key
+            heapq.heappush(self.queue, (*key, index))
+        else:
+            self.queued.pop(index, None)
+
+    def update_neighbors(self, index):
+        """
+        Recompute every open neighbor of a cell after its distance changed.
+        """
+        open_cells = self.solver.open_cells
+        for offset in self.solver.offsets:
+            if open_cells[index + offset]:
+                self.update_cell(index + offset)
+
+    def compute_shortest_path(self):
+        """
+        Expand inconsistent cells in key order until the distance from the start is known again.
+        """
+        queue, queued, g, rhs, start = self.queue, self.queued, self.g, self.rhs, self.start
+        expanded = 0
+        while queue:
+            first, second, current = queue[0]
+            if queued.get(current) != (first, second):  # Stale entry, the cell was queued again or is consistent
+                heapq.heappop(queue)
+                continue
+            if (first, second) >= self.key(start) and rhs[start] == g[start]:
+                break
+            heapq.heappop(queue)
+            key = self.key(current)
+            if (first, second) < key:  # The cell got further away since it was queued
+                queued[current] = key
+                heapq.heappush(queue, (*key, current))
+                continue
+            del queued[current]
+            expanded += 1
+            if g[current] > rhs[current]:  # Shorter than before: settle it
+                g[current] = rhs[current]
+            else:  # Longer than before: forget it and recompute it from its neighbors
+                g[current] = INFINITY
+                self.update_cell(current)
+            self.update_neighbors(current)
+        self.expanded = expanded
+
+    def set_wall(self, x, y, blocked):
+        """
+        Close (blocked=True) or open the board cell (x, y), repair the search and return the new shortest path.
+        The board of characters is only updated when the solver has already unpacked it: a board still held
+        in the maze file (or that the solver never had, see astar.Solver.use_grid) keeps the maze as loaded.
+        """
+        solver = self.solver
+        if not (0 <= x < solver.rows and 0 <= y < solver.columns):
+            raise ValueError(f"{(x, y)} is outside of the maze")
+        index = solver.index((x, y))
+        if solver.open_cells[index] != blocked:  # Nothing changes
+            self.expanded = 0
+            return self.path()
+        solver.open_cells[index] = not blocked
+        if solver._board is not None:  # Reading solver.board would unpack a lazy board
+            solver._board[x][y] = solver.wall if blocked else solver.route
+        self.update_cell(index)
+        self.update_neighbors(index)
+        self.compute_shortest_path()
+        return self.path()
+
+    def path(self):
+        """
+        Follow the decreasing distances from the start to the finish.
+        Return the path as a list of (x, y) board positions like astar.Solver.reconstruct_path, or None.
+        """
+        open_cells, offsets, g = self.solver.open_cells, self.solver.offsets, self.g
+        current = self.start
+        if g[current] >= INFINITY or not open_cells[current]:
+            return None
+        path = [current]
+        while current != self.goal:
+            current = min((current + offset for offset in offsets if open_cells[current + offset]), key=g.__getitem__)
+            path.append(current)
+        return [self.solver.position(index) for index in path]
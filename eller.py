@@ -0,0 +1,97 @@
+import random
+from maze_file import pack_row, row_stride, write_header
+
+WALL = ord('#')
+ROUTE = ord('.')
+
+
+class Maze:
+    def __init__(self, name, n, height=None):
+        """
+        Initialize a maze with a name, a width of n cells and a height (n by default).
+        Nothing is allocated here: the maze only exists one row at a time while it is generated.
+        """
+        self.name = name
+        self.n = n
+        self.height = n if height is None else height
+
+    def eller(self):
+        """
+        Generate the maze using Eller's algorithm, yielding the rendered lines of the maze one by one.
+        Only the set labels of the current row are kept in memory.
+        """
+        n = self.n
+        sets = list(range(n))  # Set label of each cell of the current row
+        members = {label: [label] for label in range(n)}  # Cells of the current row in each set
+        next_label = n
+
+        top = bytearray([WALL]) * (2 * n + 1)  # Top border
+        top[0] = ROUTE  # Start cell
+        yield top
+
+        for row in range(self.height):
+            last_row = row == self.height - 1
+            east = bytearray([WALL]) * n
+            for y in range(n - 1):
+                first, second = sets[y], sets[y + 1]
+                if first != second and (last_row or random.random() < 0.5):  # The last row joins every set left
+                    east[y] = ROUTE  # Break the east wall
+                    if len(members[first]) < len(members[second]):  # Relabel the smaller set
+                        first, second = second, first
+                    for column in members[second]:
+                        sets[column] = first
+                    members[first].extend(members.pop(second))
+            line = bytearray([WALL]) * (2 * n + 1)
+            line[1::2] = bytes([ROUTE]) * n  # Cells are represented by '.'
+            line[2::2] = east
+            if row == 0:
+                line[0] = ROUTE  # Start cell
+            if last_row:
+                line[-1] = ROUTE  # Finish cell
+            yield line
+
+            south = bytearray([WALL]) * n
+            if not last_row:
+                for columns in members.values():  # Every set goes down at least once
+                    down = [column for column in columns if random.random() < 0.5] or [random.choice(columns)]
+                    for column in down:
+                        south[column] = ROUTE  # Break the south wall
+                members = {}
+                for column in range(n):
+                    if south[column] == WALL:  # Cells not connected from above start a new set
+                        sets[column] = next_label
+                        next_label += 1
+                    members.setdefault(sets[column], []).append(column)
+            line = bytearray([WALL]) * (2 * n + 1)
+            line[1::2] = south
+            if last_row:
+                line[-1] = ROUTE  # Finish cell
+            yield line
+
+    def save_maze_to_txt(self, filename, binary_filename=None, seed=None):
+        """
+        Generate the maze and append each line to the text file as soon as it is ready.
+        The binary maze file is written at the same time when a name is given.
+        """
+        stride = row_stride(2 * self.n + 1)
+        with open(filename, 'wb') as file:
+            binary_file = open(binary_filename, 'wb') if binary_filename else None
+            try:
+                if binary_file:
+                    write_header(binary_file, 2 * self.height + 1, 2 * self.n + 1, seed=seed)
+                for index, line in enumerate(self.eller()):
+                    if index:
+                        file.write(b"\n")
+                    file.write(line)
+                    if binary_file:
+                        binary_file.write(pack_row(line, stride))
+            finally:
+                if binary_file:
+                    binary_file.close()
+
+
+if __name__ == "__main__":
+    n = int(input("Enter the width of the maze: "))  # User input for maze width
+    height = int(input("Enter the height of the maze: "))  # User input for maze height
+    maze = Maze("maze", n, height)  # Create a maze object
+    maze.save_maze_to_txt('maze.txt', 'maze.bin')  # Generate the maze straight to the text and binary files
@@ -0,0 +1,25 @@
+import numpy as np
+
+# NumPy helpers of the generators drawing whole bands of rows at once, kept out of maze_core
+# so that the other generators and the solvers do not need NumPy.
+
+
+def band_rows(n, cells=1 << 22):
+    """
+    Get the number of rows of about cells cells to generate at once in a grid n cells wide.
+    It is a multiple of 4, so that every band starts on a byte of the packed walls.
+    """
+    return max(4, cells // n // 4 * 4)
+
+
+def carve_rows(grid, first_row, east, south):
+    """
+    Open the passages of a band of whole rows of a maze_core.WallGrid at once from two boolean arrays
+    of shape (rows, n), True where the EAST or SOUTH passage of a cell is open. Cells of the band that were
+    carved before are reset. The band must start on a byte, that is first_row * n must be a multiple of 4.
+    """
+    codes = (east.astype(np.uint8) | south.astype(np.uint8) << 1).ravel()
+    codes = np.pad(codes, (0, -codes.size % 4)).reshape(-1, 4)  # 4 cells per byte, first cell in the low bits
+    packed = codes[:, 0] | codes[:, 1] << 2 | codes[:, 2] << 4 | codes[:, 3] << 6
+    start = first_row * grid.n >> 2
+    grid.bits[start:start + packed.size] = packed.tobytes()
@@ -0,0 +1,148 @@
+import heapq
+from array import array
+
+
+class JunctionGraph:
+    def __init__(self, solver):
+        """
+        Contract the maze loaded in an astar.Solver into a weighted graph.
+        Junctions, dead ends, the start and the finish are the nodes, and every corridor of cells
+        with exactly two open neighbors becomes a single edge weighted by its length.
+        The graph can be reused for any number of queries.
+        """
+        self.solver = solver
+        self.nodes = {}  # Flat grid index -> node number
+        self.cells = array('i')  # Node number -> flat grid index
+        self.edges = []  # Node number -> {first offset taken from the node: (neighbor node, corridor length)}
+        self.expanded = 0  # Number of nodes expanded by the last search
+        open_cells, offsets = solver.open_cells, solver.offsets
+        keep = {solver.index(solver.start), solver.index(solver.finish)}
+        for index in range(len(open_cells)):
+            if open_cells[index] and (index in keep or sum(open_cells[index + offset] for offset in offsets) != 2):
+                self.add_node(index)
+        for node, index in enumerate(self.cells):
+            for offset in offsets:
+                if open_cells[index + offset]:
+                    end, length, _ = self.follow(index, offset)
+                    self.edges[node][offset] = (self.nodes[end], length)
+
+    def add_node(self, index):
+        """
+        Add a node without edges for the cell at the flat grid index.
+        """
+        self.nodes[index] = len(self.cells)
+        self.cells.append(index)
+        self.edges.append({})
+
+    def follow(self, index, offset):
+        """
+        Follow the corridor leaving the cell in the direction of offset until the next node.
+        Return the index of that node, the corridor length and the last offset taken.
+        """
+        open_cells, offsets, nodes = self.solver.open_cells, self.solver.offsets, self.nodes
+        previous, current, length = index, index + offset, 1
+        while current not in nodes and current != index:
+            for step in offsets:
+                if open_cells[current + step] and current + step != previous:
+                    break
+            previous, current, offset, length = current, current + step, step, length + 1
+        return current, length, offset
+
+    def split(self, position):
+        """
+        Make the board position a node by splitting the corridor it belongs to.
+        Return the number of the new node, or None if the position already was a node.
+        """
+        index = self.solver.index(position)
+        if not self.solver.open_cells[index]:
+            raise ValueError(f"{position} is a wall")
+        if index in self.nodes:
+            return None
+        self.add_node(index)
+        node = self.nodes[index]
+        for offset in self.solver.offsets:
+            if self.solver.open_cells[index + offset]:
+                end, length, last_offset = self.follow(index, offset)
+                self.edges[node][offset] = (self.nodes[end], length)
+                self.edges[self.nodes[end]][-last_offset] = (node, length)  # The end now stops at the new node
+        return node
+
+    def remove(self, node):
+        """
+        Remove the last node added by split, joining back the two halves of its corridor.
+        """
+        del self.nodes[self.cells[node]]  # Corridors now walk through the cell
+        for neighbor, _ in self.edges[node].values():
+            for offset, (other, _) in list(self.edges[neighbor].items()):
+                if other == node and neighbor != node:
+                    end, length, _ = self.follow(self.cells[neighbor], offset)
+                    self.edges[neighbor][offset] = (self.nodes[end], length)
+        self.cells.pop()
+        self.edges.pop()
+
+    def solve(self, start=None, finish=None):
+        """
+        Solve the maze with A* on the junction graph, from start to finish (the solver ones by default).
+        Return the path as a list of (x, y) board positions like astar.Solver.reconstruct_path, or None.
+        """
+        start = self.solver.start if start is None else start
+        finish = self.solver.finish if finish is None else finish
+        added = [node for node in (self.split(start), self.split(finish)) if node is not None]
+        try:
+            return self.search(self.nodes[self.solver.index(start)], self.nodes[self.solver.index(finish)])
+        finally:
+            for node in reversed(added):  # Temporary nodes are removed last in, first out
+                self.remove(node)
+
+    def search(self, start, finish):
+        """
+        Run A* between two nodes with the Manhattan distance, which never overestimates a corridor length.
+        """
+        width = self.solver.width
+        finish_x, finish_y = divmod(self.cells[finish], width)
+        g_score = {start: 0}
+        parents = {start: (None, 0)}  # Node -> (previous node, offset taken from it)
+        closed = set()
+        open_set = [(0, 0, start)]
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue
+            if current == finish:
+                self.expanded = len(closed)
+                return self.expand(finish, parents)
+            closed.add(current)
+            for offset, (neighbor, length) in self.edges[current].items():
+                tentative_g = g_score[current] + length
+                if neighbor not in closed and tentative_g < g_score.get(neighbor, tentative_g + 1):
+                    g_score[neighbor] = tentative_g
+                    parents[neighbor] = (current, offset)
+                    x, y = divmod(self.cells[neighbor], width)
+                    h = abs(x - finish_x) + abs(y - finish_y)
+                    heapq.heappush(open_set, (tentative_g + h, h, neighbor))
+        self.expanded = len(closed)
+        return None
+
+    def expand(self, node, parents):
+        """
+        Expand the chain of nodes ending at node back into the full path of board positions.
+        """
+        open_cells, offsets = self.solver.open_cells, self.solver.offsets
+        path = []
+        previous_node, offset = parents[node]
+        while previous_node is not None:
+            corridor = []
+            origin = self.cells[previous_node]
+            previous, current = origin, origin + offset
+            while current != self.cells[node]:
+                corridor.append(current)
+                for step in offsets:
+                    if open_cells[current + step] and current + step != previous:
+                        break
+                previous, current = current, current + step
+            corridor.append(current)
+            path.extend(reversed(corridor))
+            node = previous_node
+            previous_node, offset = parents[node]
+        path.append(self.cells[node])
+        return [self.solver.position(index) for index in reversed(path)]
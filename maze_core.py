@@ -0,0 +1,194 @@
+from maze_file import save_binary
+
+EAST = 1  # Bit set when the passage to the east neighbor is open
+SOUTH = 2  # Bit set when the passage to the south neighbor is open
+
+# For each direction: offset of the cell owning the wall and the bit storing it
+WALL_OWNERS = {'N': (-1, 0, SOUTH), 'E': (0, 0, EAST), 'S': (0, 0, SOUTH), 'W': (0, -1, EAST)}
+DIRECTIONS = {'N': (-1, 0), 'E': (0, 1), 'S': (1, 0), 'W': (0, -1)}
+
+# Translation tables turning a packed byte into the '.'/'#' character of its k-th cell, for k in 0..3
+EAST_CHARS = [bytes(ord('.') if byte >> (2 * k) & EAST else ord('#') for byte in range(256)) for k in range(4)]
+SOUTH_CHARS = [bytes(ord('.') if byte >> (2 * k) & SOUTH else ord('#') for byte in range(256)) for k in range(4)]
+
+
+class WallGrid:
+    def __init__(self, n, height=None):
+        """
+        Initialize a grid n cells wide and height cells tall (n by default) with every wall up.
+        Each cell only stores its east and south walls, packed 2 bits per cell (4 cells per byte).
+        """
+        self.n = n
+        self.height = n if height is None else height
+        self.bits = bytearray((n * self.height + 3) // 4)
+
+    def is_open(self, number, wall):
+        """
+        Check if the EAST or SOUTH passage of the cell with the given number is open.
+        """
+        return self.bits[number >> 2] >> ((number & 3) << 1) & wall != 0
+
+    def carve(self, number, wall):
+        """
+        Open the EAST or SOUTH passage of the cell with the given number.
+        """
+        self.bits[number >> 2] |= wall << ((number & 3) << 1)
+
+    def has_wall(self, x, y, direction):
+        """
+        Check if the cell (x, y) has a wall in the given direction. The outer border is always a wall.
+        """
+        dx, dy, wall = WALL_OWNERS[direction]
+        nx, ny = x + DIRECTIONS[direction][0], y + DIRECTIONS[direction][1]
+        if not (0 <= nx < self.height and 0 <= ny < self.n):
+            return True
+        return not self.is_open((x + dx) * self.n + y + dy, wall)
+
+    def break_wall(self, x, y, direction):
+        """
+        Break the wall of the cell (x, y) in the given direction.
+        """
+        dx, dy, wall = WALL_OWNERS[direction]
+        self.carve((x + dx) * self.n + y + dy, wall)
+
+
+class Cell:
+    __slots__ = ('grid', 'x', 'y')
+
+    def __init__(self, grid, x, y):
+        """
+        Initialize a lightweight view of the cell (x, y) of a wall grid.
+        """
+        self.grid = grid
+        self.x = x
+        self.y = y
+
+    @property
+    def walls(self):
+        """
+        Boolean values representing the presence of walls, read from the grid.
+        """
+        return {direction: self.grid.has_wall(self.x, self.y, direction) for direction in 'NESW'}
+
+    def break_wall(self, direction, next_cell):
+        """
+        Break the wall between the current cell and the next cell in the given direction.
+        """
+        self.grid.break_wall(self.x, self.y, direction)
+
+
+class Board:
+    def __init__(self, grid, cell_class=Cell):
+        """
+        Initialize a board view so that board[x][y] returns the cell (x, y) of the grid.
+        """
+        self.grid = grid
+        self.cell_class = cell_class
+
+    def __len__(self):
+        return self.grid.height
+
+    def __getitem__(self, x):
+        if not 0 <= x < self.grid.height:
+            raise IndexError(x)
+        return BoardRow(self.grid, x, self.cell_class)
+
+
+class BoardRow:
+    def __init__(self, grid, x, cell_class):
+        """
+        Initialize a view of the row x of a wall grid.
+        """
+        self.grid = grid
+        self.x = x
+        self.cell_class = cell_class
+
+    def __len__(self):
+        return self.grid.n
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.grid.n:
+            raise IndexError(y)
+        return self.cell_class(self.grid, self.x, y)
+
+
+class GridMaze:
+    cell_class = Cell  # Cell view returned by the board
+
+    def __init__(self, name, n, height=None):
+        """
+        Initialize a maze with a name and size n x n, or n wide and height tall.
+        """
+        self.name = name
+        self.n = n
+        self.height = n if height is None else height
+        self.grid = WallGrid(n, self.height)  # Packed walls of the maze
+        self.board = Board(self.grid, self.cell_class)  # board[x][y] view on the grid
+        self.seed = None  # Seed the maze was generated with, if known, stored in its binary file
+
+    def check_neighbors(self, current_cell):
+        """
+        Get the neighboring cells of the current cell.
+        """
+        neighbors = []
+        for direction, (dx, dy) in DIRECTIONS.items():
+            nx, ny = current_cell.x + dx, current_cell.y + dy
+            if 0 <= nx < self.height and 0 <= ny < self.n:
+                neighbors.append((self.cell_class(self.grid, nx, ny), direction))
+        return neighbors
+
+    def wall_chars(self, tables):
+        """
+        Unpack one wall of every cell into a buffer of n*height '.' (open) or '#' (wall) characters.
+        """
+        chars = bytearray(4 * len(self.grid.bits))
+        for k in range(4):
+            chars[k::4] = self.grid.bits.translate(tables[k])  # Cells k, k+4, k+8, ... in one pass
+        return memoryview(chars)[:self.n * self.height]
+
+    def render_maze(self):
+        """
+        Render the maze into a (2*height+1) x (2n+2) character buffer, the last column holding the newlines.
+        """
+        n = self.n
+        width = 2 * n + 2
+        maze_display = bytearray(b"#") * (width * (2 * self.height + 1))  # Walls everywhere to start with
+        maze_display[width - 1::width] = b"\n" * (2 * self.height + 1)
+        east, south = self.wall_chars(EAST_CHARS), self.wall_chars(SOUTH_CHARS)
+        cells = b"." * n
+        for row in range(self.height):
+            start = (2 * row + 1) * width
+            maze_display[start + 1:start + 2 * n:2] = cells  # Cells are represented by '.'
+            maze_display[start + 2:start + 2 * n + 1:2] = east[row * n:(row + 1) * n]  # East walls
+            maze_display[start + width + 1:start + width + 2 * n:2] = south[row * n:(row + 1) * n]  # South walls
+        maze_display[0] = maze_display[width] = ord(".")  # Start cell
+        maze_display[-2] = maze_display[-2 - width] = ord(".")  # Finish cell
+        return memoryview(maze_display)[:-1]  # No newline after the last row
+
+    def print_maze(self):
+        """
+        Generate a string representation of the maze.
+        """
+        return self.render_maze().tobytes().decode()
+
+    def write_maze(self, filename):
+        """
+        Write the rendered maze to a file in a single write.
+        """
+        with open(filename, 'wb') as file:
+            file.write(self.render_maze())
+
+    def save_maze_to_txt(self, filename):
+        """
+        Save the maze to a text file.
+        """
+        self.write_maze(filename)
+
+    def save_maze_to_binary(self, filename, seed=None):
+        """
+        Save the maze to a binary maze file (see maze_file), with the given seed or else the one it was generated with.
+        """
+        maze_display = self.render_maze()
+        width = 2 * self.n + 2
+        rows = [maze_display[row * width:row * width + width - 1] for row in range(2 * self.height + 1)]
+        save_binary(filename, rows, seed=self.seed if seed is None else seed)
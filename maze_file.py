@@ -0,0 +1,134 @@
+import mmap
+import struct
+
+# Header: magic, version, rows, columns, start (x, y), finish (x, y) and generator seed (-1 if unknown)
+MAGIC = b'MAZB'
+VERSION = 1
+HEADER = struct.Struct('<4sIIIIIIIq')
+
+TO_BITS = bytes.maketrans(b'.#', b'10')  # Open cells are stored as 1, walls as 0
+FROM_BITS = bytes.maketrans(b'10', b'.#')
+CELL_FLAGS = [bytes(byte >> k & 1 for k in range(8)) for byte in range(256)]  # Packed byte -> 8 open cell flags
+
+
+def row_stride(columns):
+    """
+    Number of bytes used by one packed row, rows start on a byte boundary.
+    """
+    return (columns + 7) // 8
+
+
+def pack_row(row, stride):
+    """
+    Pack a row of '.'/'#' characters into bytes, column y being bit y % 8 of byte y // 8.
+    """
+    return int(bytes(row).translate(TO_BITS)[::-1] or b'0', 2).to_bytes(stride, 'little')
+
+
+def unpack_row(packed, columns):
+    """
+    Unpack a row of bytes back into its '.'/'#' characters.
+    """
+    bits = format(int.from_bytes(packed, 'little'), f'0{len(packed) * 8}b')
+    return bits[::-1][:columns].encode().translate(FROM_BITS)
+
+
+def save_binary(filename, rows, start=(0, 0), finish=None, seed=None):
+    """
+    Save a maze given as rows of '.'/'#' characters to a binary file.
+    """
+    stride = row_stride(len(rows[0]))
+    with open(filename, 'wb') as file:
+        write_header(file, len(rows), len(rows[0]), start, finish, seed)
+        for row in rows:
+            file.write(pack_row(row, stride))
+
+
+def write_header(file, rows, columns, start=(0, 0), finish=None, seed=None):
+    """
+    Write the header of a binary maze file, the finish defaults to the bottom-right cell.
+    """
+    if finish is None:
+        finish = (rows - 1, columns - 1)
+    file.write(HEADER.pack(MAGIC, VERSION, rows, columns, *start, *finish, -1 if seed is None else seed))
+
+
+def is_binary_maze(filename):
+    """
+    Check if a file starts with the binary maze header.
+    """
+    with open(filename, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+class MazeFile:
+    def __init__(self, filename):
+        """
+        Open a binary maze file. Only the header is read, the grid is paged in lazily through mmap.
+        """
+        with open(filename, 'rb') as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.columns, start_x, start_y, finish_x, finish_y, seed = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} is not a binary maze file")
+        self.start = (start_x, start_y)
+        self.finish = (finish_x, finish_y)
+        self.seed = None if seed == -1 else seed
+        self.stride = row_stride(self.columns)
+
+    def is_open(self, x, y):
+        """
+        Check if the board cell (x, y) is not a wall.
+        """
+        return self.data[HEADER.size + x * self.stride + (y >> 3)] >> (y & 7) & 1 == 1
+
+    def row(self, x):
+        """
+        Get the row x of the board as '.'/'#' bytes.
+        """
+        offset = HEADER.size + x * self.stride
+        return unpack_row(self.data[offset:offset + self.stride], self.columns)
+
+    def open_rows(self):
+        """
+        Yield the rows of the board as open cell flags: one byte per cell, 1 for open and 0 for a wall.
+        """
+        for x in range(self.rows):
+            offset = HEADER.size + x * self.stride
+            yield b"".join(map(CELL_FLAGS.__getitem__, self.data[offset:offset + self.stride]))[:self.columns]
+
+    def board(self):
+        """
+        Build the list of lists of characters used by the solvers.
+        """
+        return [list(self.row(x).decode()) for x in range(self.rows)]
+
+    def close(self):
+        """
+        Unmap the file.
+        """
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def text_to_binary(text_file, binary_file, seed=None):
+    """
+    Convert a maze text file to the binary format.
+    """
+    with open(text_file, 'rb') as file:
+        rows = file.read().split()
+    save_binary(binary_file, rows, seed=seed)
+
+
+def binary_to_text(binary_file, text_file):
+    """
+    Convert a binary maze file back to the text format.
+    """
+    with MazeFile(binary_file) as maze, open(text_file, 'wb') as file:
+        for x in range(maze.rows):  # One row at a time, the maze may not fit in memory
+            file.write(b'\n' + maze.row(x) if x else maze.row(x))
@@ -0,0 +1,127 @@
+import os
+import sys
+import mmap
+import shutil
+import tempfile
+from maze_file import MazeFile, is_binary_maze, binary_to_text
+
+WALL, ROUTE, PATH, DEAD_END = b'#.o*'
+
+
+def prepare(source, output):
+    """
+    Copy a text maze, or convert a binary one, to the text file that will be solved in place.
+    Return the start and finish stored in a binary maze, or (None, None) for a text maze.
+    """
+    if is_binary_maze(source):
+        binary_to_text(source, output)
+        with MazeFile(source) as maze_file:
+            return maze_file.start, maze_file.finish
+    shutil.copyfile(source, output)
+    return None, None
+
+
+class Solver:
+    def __init__(self, file, start=(0, 0), finish=None):
+        """
+        Open a text maze file to solve it in place through mmap, without loading it in memory.
+        Rows must all have the same length and end with a newline (except the last one), so that
+        the cell (x, y) is the byte x * stride + y of the file. The finish defaults to the last cell.
+        """
+        with open(file, 'r+b') as maze_file:
+            self.data = mmap.mmap(maze_file.fileno(), 0)
+        self.columns = self.data.find(b'\n')
+        if self.columns == -1:
+            self.columns = len(self.data)
+        self.stride = self.columns + 1  # Row length including its newline
+        self.rows = (len(self.data) + 1) // self.stride
+        self.start = start
+        self.finish = finish if finish is not None else (self.rows - 1, self.columns - 1)
+        # Direction taken to reach each byte of the file, 2 bits per byte, in a temporary file next to the maze
+        self.parents_file = tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(file)))
+        self.parents_file.truncate(len(self.data) // 4 + 1)
+        self.parents = mmap.mmap(self.parents_file.fileno(), 0)
+        self.steps = (self.stride, 1, -self.stride, -1)  # Down, right, up, left: toward the default finish first
+        self.expanded = 0  # Number of cells visited by the last search
+        self.backtracks = 0  # Number of dead ends left by the last search
+        self.stats = None  # SolverStats to fill during the searches, if any
+
+    def offset(self, position):
+        """
+        Convert a (x, y) board position to its byte offset in the file.
+        """
+        return position[0] * self.stride + position[1]
+
+    def solve(self):
+        """
+        Solve the maze with a depth-first search marking the file itself: visited cells are marked with 'o'
+        and turned into '*' when they are left as dead ends, so only the path is left marked with 'o'.
+        Instead of a stack, the direction taken to reach each cell is kept in the disk-backed parents array.
+        Return the number of cells of the path, or None if the finish cannot be reached.
+        """
+        data, parents, steps, size = self.data, self.parents, self.steps, len(self.data)
+        current, finish = self.offset(self.start), self.offset(self.finish)
+        if data[current] == WALL or data[finish] == WALL:
+            return None
+        data[current] = PATH
+        depth = 0
+        self.expanded, self.backtracks = 1, 0
+        while current != finish:
+            for code, step in enumerate(steps):
+                neighbor = current + step
+                if 0 <= neighbor < size and data[neighbor] == ROUTE:  # Newlines stop moves past the row ends
+                    break
+            else:
+                if depth == 0:
+                    break  # Back at the start with nothing left to visit
+                data[current] = DEAD_END
+                current -= steps[parents[current >> 2] >> ((current & 3) << 1) & 3]
+                depth -= 1
+                self.backtracks += 1
+                continue
+            shift = (neighbor & 3) << 1
+            parents[neighbor >> 2] = parents[neighbor >> 2] & ~(3 << shift) | code << shift
+            data[neighbor] = PATH
+            current = neighbor
+            depth += 1
+            self.expanded += 1
+        if self.stats is not None:
+            self.stats.expanded += self.expanded
+            self.stats.backtracks += self.backtracks
+        return depth + 1 if current == finish else None
+
+    def path_back(self):
+        """
+        Yield the (x, y) positions of the path found by solve, from the finish back to the start.
+        """
+        current, start = self.offset(self.finish), self.offset(self.start)
+        while True:
+            yield divmod(current, self.stride)
+            if current == start:
+                return
+            current -= self.steps[self.parents[current >> 2] >> ((current & 3) << 1) & 3]
+
+    def close(self):
+        """
+        Flush the marks to the maze file and release the mappings.
+        """
+        self.data.flush()
+        self.data.close()
+        self.parents.close()
+        self.parents_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        sys.exit("Usage: python mmap_solver.py MAZE_FILE [SOLUTION_FILE]")
+    output = sys.argv[2] if len(sys.argv) == 3 else "solved_maze.txt"
+    start, finish = prepare(sys.argv[1], output)  # The solution is written over a copy of the maze
+    with Solver(output, start or (0, 0), finish) as solver:
+        length = solver.solve()
+    print("No Solution" if length is None else f"Path of {length} cells saved to {output}")
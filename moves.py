@@ -0,0 +1,43 @@
+import re
+
+MOVES = {(1, 0): 'S', (-1, 0): 'N', (0, 1): 'E', (0, -1): 'W'}  # Step between adjacent cells and its letter
+STEPS = {letter: step for step, letter in MOVES.items()}
+
+
+def encode_moves(path):
+    """
+    Encode a path of adjacent cells as run-length moves, e.g. [(0, 0), (1, 0), (2, 0), (2, 1)] gives "2S1E".
+    """
+    runs = []
+    for (x, y), (next_x, next_y) in zip(path, path[1:]):
+        letter = MOVES[(next_x - x, next_y - y)]
+        if runs and runs[-1][1] == letter:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, letter])
+    return "".join(f"{count}{letter}" for count, letter in runs)
+
+
+def decode_moves(start, moves):
+    """
+    Decode run-length moves back into the path of cells starting at start.
+    """
+    path = [tuple(start)]
+    x, y = start
+    for count, letter in re.findall(r'(\d+)([NESW])', moves):
+        dx, dy = STEPS[letter]
+        for _ in range(int(count)):
+            x, y = x + dx, y + dy
+            path.append((x, y))
+    return path
+
+
+def gaps(indices):
+    """
+    Yield the differences between consecutive sorted indices, the first one from 0.
+    Dead ends come in long corridors, so most gaps only take one or two digits.
+    """
+    previous = 0
+    for index in indices:
+        yield index - previous
+        previous = index
@@ -0,0 +1,100 @@
+import queue
+import multiprocessing
+from multiprocessing import shared_memory
+from astar import Solver as AStarSolver
+from bidirectional_solver import Solver as BidirectionalSolver
+from backtracking_solver import Solver as BacktrackingSolver
+from cache import find_dead_ends, mark_solution
+from stats import SolverStats
+
+PORTFOLIO = {'astar': AStarSolver, 'bidirectional': BidirectionalSolver,
+             'backtracking': BacktrackingSolver}  # Solver class of each solver of the portfolio
+POLL_SECONDS = 0.5  # How often the racers are checked for a crash while no answer comes
+CELL_CHARACTERS = bytes.maketrans(b'\x00\x01', b'#.')  # Open cell flags back to board characters
+
+
+def race(name, memory_name, rows, columns, start, finish, results, track=False):
+    """
+    Solve the maze whose padded bitmap of open cells (see astar.Solver.load_grid) is held in shared memory
+    with one solver of the portfolio and put (name, path, dead ends, stats) in the results queue,
+    or (name, None, None, None) if the solver failed. Run in a process of its own.
+    A* and the bidirectional search read the shared bitmap in place, only the backtracking solver,
+    which marks its board while it searches, gets a private board of characters.
+    """
+    try:
+        memory = shared_memory.SharedMemory(name=memory_name)
+        open_cells = memory.buf[:(rows + 2) * (columns + 2)]
+        try:
+            if name == 'backtracking':
+                width = columns + 2
+                solver = PORTFOLIO[name]()
+                solver.load_board([list(bytes(open_cells[x * width + 1:x * width + 1 + columns])
+                                        .translate(CELL_CHARACTERS).decode()) for x in range(1, rows + 1)], finish)
+            else:
+                solver = PORTFOLIO[name]()
+                solver.board = None  # No board of characters to mark the path on
+                solver.use_grid(open_cells, rows, columns, finish)
+            solver.start = start
+            solver.stats = SolverStats() if track else None
+            path = solver.solve()
+        finally:
+            if name != 'backtracking':
+                solver.open_cells = bytearray()  # Drop the last reference to the view before closing the memory
+            open_cells.release()
+            memory.close()
+        dead_ends = find_dead_ends(solver.board) if name == 'backtracking' else []
+        results.put((name, path, dead_ends, solver.stats))
+    except Exception:
+        results.put((name, None, None, None))
+        raise
+
+
+def solve_portfolio(solver, solvers=PORTFOLIO):
+    """
+    Race several solvers in separate processes on the maze loaded in an astar.Solver and keep the first answer.
+    The padded bitmap of open cells is put once in shared memory for all of them, and the slower ones are terminated.
+    The winning solution is marked on the board of the solver and the counters of the winner are added to its stats.
+    Return the name of the winner, its path (None if the maze has no solution) and its dead ends as flat cell indices.
+    Raise RuntimeError if every solver failed or died.
+    """
+    rows, columns = solver.rows, solver.columns
+    memory = shared_memory.SharedMemory(create=True, size=len(solver.open_cells))
+    try:
+        memory.buf[:len(solver.open_cells)] = solver.open_cells
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=race, daemon=True,
+                                             args=(name, memory.name, rows, columns, solver.start, solver.finish,
+                                                   results, solver.stats is not None))
+                     for name in solvers]
+        for process in processes:
+            process.start()
+        try:
+            answered = 0
+            while True:
+                try:
+                    name, path, dead_ends, stats = results.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    if any(process.is_alive() for process in processes):
+                        continue
+                    try:  # Every racer is gone, an answer may still be on its way through the queue
+                        name, path, dead_ends, stats = results.get(timeout=POLL_SECONDS)
+                    except queue.Empty:
+                        exit_codes = ", ".join(f"{name} {process.exitcode}"
+                                               for name, process in zip(solvers, processes))
+                        raise RuntimeError(f"Every solver of the portfolio died without answering ({exit_codes})")
+                answered += 1
+                if dead_ends is not None:  # Skip the solvers that failed
+                    break
+                if answered == len(processes):
+                    raise RuntimeError("Every solver of the portfolio failed")
+        finally:
+            for process in processes:
+                process.terminate()  # Cancel the solvers still running
+                process.join()
+    finally:
+        memory.close()
+        memory.unlink()
+    if solver.stats is not None and stats is not None:
+        solver.stats.add(stats)
+    mark_solution(solver.board, path or (), dead_ends)
+    return name, path, dead_ends
@@ -1,36 +1,67 @@
 import os
-import copy
-from PIL import Image, ImageDraw
+import random
+import numpy as np
+from PIL import Image
 from backtracking import Maze as BacktrackingMaze
 from kruskal import Maze as KruskalMaze
+from eller import Maze as EllerMaze
+from tiled import Maze as TiledMaze, TILE_GENERATORS
+from binary_tree import Maze as BinaryTreeMaze
+from sidewinder import Maze as SidewinderMaze
+from wilson import Maze as WilsonMaze
 from astar import Solver as AStarSolver
 from backtracking_solver import Solver as BacktrackingSolver
+from deadend_solver import Solver as DeadEndSolver
+from bitboard_solver import Solver as BitboardSolver
+from bidirectional_solver import Solver as BidirectionalSolver
+from portfolio import solve_portfolio
+from stats import SolverStats, stage
+from cache import SolutionCache, find_dead_ends, mark_solution
+from solution_file import save_compact, unsolved_rows
 
 # Define the colors for '*' and 'o' cells
 color_dead_end = (255, 0, 0)  # Red for dead ends ('*')
 color_path = (0, 255, 0)      # Green for path cells ('o')
+color_wall = (255, 255, 255)  # White for walls ('#')
+color_other = (0, 0, 0)       # Black for other characters
 
-def create_colored_maze_image(board):
+# Map every board character to a palette index, then every palette index to its color
+palette_index = np.zeros(256, dtype=np.uint8)
+palette_index[ord('#')] = 1
+palette_index[ord('*')] = 2
+palette_index[ord('o')] = 3
+palette_colors = np.array([color_other, color_wall, color_dead_end, color_path], dtype=np.uint8)
+
+solver_classes = {'1': AStarSolver, '2': BacktrackingSolver, '3': DeadEndSolver, '4': BitboardSolver,
+                  '5': BidirectionalSolver, '6': AStarSolver}  # Solver of each solving algorithm
+solver_names = {'1': 'astar', '2': 'backtracking', '3': 'deadend', '4': 'bitboard', '5': 'bidirectional',
+                '6': 'portfolio'}  # Name of each solving algorithm in the solution cache
+solution_cache = SolutionCache()  # Solutions of the mazes already solved, in memory and in solved_mazes/.cache
+
+def create_colored_maze_image(board, scale=1, mode="RGB"):
     """
     Create an image representation of the maze with different colors for '*' and 'o' cells.
+    The mode is "RGB", "P" for a 4-color palette image or "1" for a 1-bit image of the walls only.
+    Each board cell becomes a scale x scale square of pixels.
     """
-    image = Image.new("RGB", (len(board[0]), len(board)))
-    draw = ImageDraw.Draw(image)
-    for y in range(len(board)):
-        for x in range(len(board[y])):
-            if board[y][x] == '#':
-                color = (255, 255, 255)  # White for walls ('#')
-            elif board[y][x] == '*':
-                color = color_dead_end
-            elif board[y][x] == 'o':
-                color = color_path
-            else:
-                color = (0, 0, 0)  # Black for other characters
-            draw.rectangle(
-                [(x, y), (x + 1, y + 1)],
-                fill=color,
-                outline=None
-            )
+    characters = np.frombuffer("".join(map("".join, board)).encode(), dtype=np.uint8).reshape(len(board), -1)
+    return indices_image(palette_index[characters], scale, mode)
+
+def indices_image(indices, scale=1, mode="RGB"):
+    """
+    Create the image of a 2D array of palette indices (see create_colored_maze_image).
+    """
+    if mode == "RGB":
+        image = Image.fromarray(palette_colors[indices])
+    elif mode == "P":
+        image = Image.fromarray(indices)
+        image.putpalette(palette_colors.tobytes())
+    elif mode == "1":
+        image = Image.fromarray(indices == 1)
+    else:
+        raise ValueError(f"Unsupported image mode: {mode}")
+    if scale != 1:
+        image = image.resize((image.width * scale, image.height * scale), Image.NEAREST)
     return image
 
 def generate_maze(algorithm):
@@ -38,23 +69,74 @@ def generate_maze(algorithm):
     Generate a maze using the specified algorithm.
     """
     n = int(input("Enter the size of the maze: "))  # User input for maze size
+    seed = random.getrandbits(63)  # Saved in maze.bin, so that the maze can be generated again
+    random.seed(seed)
     if algorithm == '1':
         maze = BacktrackingMaze("maze", n)  # Create a maze object using Backtracking
         maze.backtrack(maze.board[0][0])
-        maze_str = maze.print_maze()
-        maze.save_maze_to_txt('maze.txt', maze_str)
+        maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
     elif algorithm == '2':
         maze = KruskalMaze("maze", n)  # Create a maze object using Kruskal
         maze.kruskal()
-        maze_str = maze.print_maze()
         maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
+    elif algorithm == '3':
+        height = int(input("Enter the height of the maze: "))  # Eller's mazes can be much taller than wide
+        maze = EllerMaze("maze", n, height)  # Create a maze object using Eller's algorithm
+        maze.save_maze_to_txt('maze.txt', 'maze.bin', seed)  # Rows are written as they are generated
+    elif algorithm == '4':
+        k = int(input("Enter the number of tiles per side: "))
+        tile_algorithm = TILE_GENERATORS[int(input("Enter the tile algorithm (1. Backtracking / 2. Kruskal): ")) - 1]
+        maze = TiledMaze("maze", n)  # Create a maze object generated tile by tile on every core
+        maze.tiled(k, tile_algorithm)
+        maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
+    elif algorithm == '5':
+        maze = BinaryTreeMaze("maze", n)  # Create a maze object using the binary tree algorithm
+        maze.binary_tree(seed)
+        maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
+    elif algorithm == '6':
+        maze = SidewinderMaze("maze", n)  # Create a maze object using the sidewinder algorithm
+        maze.sidewinder(seed)
+        maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
+    elif algorithm == '7':
+        maze = WilsonMaze("maze", n)  # Create a maze object using Wilson's algorithm
+        maze.wilson(seed)
+        maze.save_maze_to_txt('maze.txt')
+        maze.save_maze_to_binary('maze.bin', seed)
 
-def solve_maze(algorithm):
+def maze_to_solve():
+    """
+    Get the file of the maze to solve: maze.bin unless maze.txt is newer, which happens when it is replaced by hand.
+    """
+    if os.path.exists("maze.bin") and (not os.path.exists("maze.txt")
+                                       or os.path.getmtime("maze.bin") >= os.path.getmtime("maze.txt")):
+        return "maze.bin"  # The compact binary maze is written right after maze.txt by the generators
+    return "maze.txt"
+
+def solve_maze(algorithm, show_image=True, scale=1, image_mode="RGB", collect_stats=False, use_cache=True,
+               compact=False, compress=False):
     """
     Solve a maze using the specified algorithm.
+    The image of the solution is opened in a viewer only when show_image is True.
+    With collect_stats, the solver counters and the time of each stage are saved to stats.json
+    next to the solution and returned.
+    With use_cache, a maze already solved by the same algorithm is rebuilt from the solution cache.
+    With compact, the solution is saved as the maze followed by its moves and dead ends (gzip-compressed
+    with compress) instead of the two full boards.
     """
-    solver = AStarSolver()  # Create an A* Solver object
-    solver.get_maze("maze.txt")  # Load the maze from the file
+    if algorithm not in solver_classes:
+        print("Invalid choice. Please select 1, 2, 3, 4, 5 or 6.")
+        return None
+    stats = SolverStats() if collect_stats else None
+    maze_file = maze_to_solve()
+    with stage(stats, "load"):
+        solver = solver_classes[algorithm]()  # Create a Solver object for the algorithm
+        solver.get_maze(maze_file)  # Load the maze from the file
+    solver.stats = stats
     output_dir = "solved_mazes"  # Directory to store the maze solutions
     if not os.path.exists(output_dir):  # Create the directory if it doesn't exist
         os.makedirs(output_dir)
@@ -63,30 +145,65 @@ def solve_maze(algorithm):
     folder_path = os.path.join(output_dir, folder_name)  # Construct the path to the folder
     if not os.path.exists(folder_path):  # Create the folder if it doesn't exist
         os.makedirs(folder_path)
-    unsolved_maze = copy.deepcopy(solver)  # Create a copy of the maze
-    if algorithm == '1':
-        solver = AStarSolver()  # Create an A* Solver object
-        solver.get_maze("maze.txt")  # Load the maze from the file
-        solver.astar_solver()  # Solve the maze using A* algorithm
-    elif algorithm == '2':
-        solver = BacktrackingSolver()  # Create a Backtracking Solver object
-        solver.get_maze("maze.txt")  # Load the maze from the file
-        solver.backtracking_solver()  # Solve the maze using Backtracking
-    file_path = os.path.join(folder_path, file_name)  # Construct the path to the txt file
-    with open(file_path, 'w') as output:  # Save the original maze to the file
-        output.write("Original Maze:\n")
-        for row in unsolved_maze.board:
-            output.write(' '.join(row) + '\n')
-    with open(file_path, 'a') as output:  # Save the maze solution to the file
-        output.write("\nSolution:\n")
-        for row in solver.board:
-            output.write(' '.join(row) + '\n')
+    solution = None
+    if use_cache:
+        with stage(stats, "cache"):
+            rows = solver.maze_rows() if isinstance(solver, AStarSolver) else solver.board  # Without unpacking maze.bin
+            cache_key = solution_cache.key(rows, solver_names.get(algorithm), solver.start, solver.finish)
+            solution = solution_cache.get(cache_key)
+    if solution is not None:  # Cache hit, rebuild the solved board from the stored path
+        mark_solution(solver.board, solution['path'], solution['dead_ends'])
+        path, dead_ends = solution['path'], solution['dead_ends']
+    else:
+        with stage(stats, "search"):
+            if algorithm == '6':
+                winner, path, dead_ends = solve_portfolio(solver)  # Race several solvers, keep the first answer
+                print("Solved first by", winner)
+            else:
+                path = solver.solve()  # Solve the maze with the algorithm of the solver class
+        dead_ends = find_dead_ends(solver.board) if algorithm in ('2', '3', '6') else []  # Only these mark dead ends
+        if use_cache and path:
+            solution_cache.put(cache_key, path, dead_ends)
+    compact_solution = {'start': solver.start, 'path': path, 'dead_ends': dead_ends} if compact else None
+    file_path, maze_image = save_solution(folder_path, file_name, None, solver.board, scale, image_mode,
+                                          stats=stats, solution=compact_solution, compress=compress)
     print("Solution saved to", file_path)
-    # Create an image representation of the solved maze with different colors
-    maze_image = create_colored_maze_image(solver.board)
-    image_path = os.path.join(folder_path, "solved_maze.png")  # Construct the path to the jpg file
-    maze_image.save(image_path)  # Save the image
-    maze_image.show()  # Display the image
+    if stats is not None:
+        stats.save_json(os.path.join(folder_path, "stats.json"))
+    if show_image:
+        maze_image.show()  # Display the image
+    return stats
+
+def save_solution(folder_path, file_name, unsolved_board, solved_board, scale=1, image_mode="RGB", save_image=True,
+                  stats=None, solution=None, compress=False):
+    """
+    Save the original maze and its solution to a txt file in the folder, along with an image of the solution.
+    The original maze is read back from the solved board when unsolved_board is None.
+    When solution is given (a dict with 'start', 'path' and 'dead_ends'), the maze is written once followed by
+    the solution, gzip-compressed with compress; solution_file.load_solved_board rebuilds the solved board.
+    Return the path of the txt file and the image (None when save_image is False).
+    """
+    file_path = os.path.join(folder_path, file_name)  # Construct the path to the txt file
+    with stage(stats, "write"):
+        if solution is not None:
+            file_path += ".gz" if compress else ""
+            save_compact(file_path, solved_board, solution['start'], solution['path'], solution['dead_ends'], compress)
+        else:
+            with open(file_path, 'w') as output:
+                output.write("Original Maze:\n")  # Save the original maze to the file
+                for row in (unsolved_board if unsolved_board is not None else unsolved_rows(solved_board)):
+                    output.write(' '.join(row) + '\n')
+                output.write("\nSolution:\n")  # Save the maze solution to the file
+                for row in solved_board:
+                    output.write(' '.join(row) + '\n')
+    if not save_image:
+        return file_path, None
+    with stage(stats, "image"):
+        # Create an image representation of the solved maze with different colors
+        maze_image = create_colored_maze_image(solved_board, scale, image_mode)
+        image_path = os.path.join(folder_path, "solved_maze.png")  # Construct the path to the jpg file
+        maze_image.save(image_path)  # Save the image
+    return file_path, maze_image
 
 if __name__ == "__main__":
     while True:
@@ -99,14 +216,24 @@ if __name__ == "__main__":
             print("Select a maze generation algorithm:")
             print("1. Backtracking")
             print("2. Kruskal")
-            generation_algorithm = input("Enter your choice (1/2): ")
+            print("3. Eller (streaming)")
+            print("4. Tiled (parallel)")
+            print("5. Binary tree")
+            print("6. Sidewinder")
+            print("7. Wilson")
+            generation_algorithm = input("Enter your choice (1/2/3/4/5/6/7): ")
             generate_maze(generation_algorithm)
         elif choice == '2':
             print("Select a maze solving algorithm:")
             print("1. A*")
             print("2. Backtracking")
-            solving_algorithm = input("Enter your choice (1/2): ")
-            solve_maze(solving_algorithm)
+            print("3. Dead-end filling")
+            print("4. Bitboard BFS")
+            print("5. Bidirectional BFS")
+            print("6. Portfolio (A*, bidirectional BFS and backtracking racing on every core)")
+            solving_algorithm = input("Enter your choice (1/2/3/4/5/6): ")
+            compact = input("Save a compact solution (maze once, moves and dead ends)? (y/n): ").lower() == 'y'
+            solve_maze(solving_algorithm, compact=compact)
         elif choice == '3':
             break
         else:
@@ -0,0 +1,262 @@
+import io
+import json
+import base64
+import random
+import socket
+import asyncio
+import argparse
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from astar import Solver as AStarSolver
+from tree_index import TreeIndex
+from junction_graph import JunctionGraph
+from moves import encode_moves
+from batch import GENERATORS, generate_rows
+from run import palette_index, indices_image
+
+DEFAULT_PORT = 8765
+
+
+class ResidentMaze:
+    def __init__(self, rows, start=(0, 0), finish=None):
+        """
+        Keep a maze in memory with an index answering path queries between any two cells:
+        a TreeIndex for perfect mazes, a JunctionGraph for mazes with loops.
+        """
+        self.solver = AStarSolver()
+        self.solver.start = start
+        self.solver.load_board([list(row) for row in rows], finish)
+        try:
+            self.index = TreeIndex(self.solver)
+        except ValueError:
+            self.index = JunctionGraph(self.solver)
+        characters = np.frombuffer("".join(rows).encode(), dtype=np.uint8).reshape(len(rows), -1)
+        self.indices = palette_index[characters]  # Palette indices of the unsolved maze, for the images
+        self.pending = []  # (start, finish, future) of the queries waiting for the next batch
+        self.solving = False  # True while a batch runs, queries arriving meanwhile wait for the next one
+
+    def path(self, start, finish):
+        """
+        Get the path between two board positions, or None if they are not connected.
+        Raise ValueError for walls and positions outside the maze.
+        """
+        for x, y in (start, finish):
+            if not (0 <= x < self.solver.rows and 0 <= y < self.solver.columns):
+                raise ValueError(f"{(x, y)} is outside the maze")
+        if isinstance(self.index, TreeIndex):
+            return self.index.path(start, finish)  # Raises ValueError for cells out of the tree
+        return self.index.solve(start, finish)
+
+    def solve_batch(self, queries):
+        """
+        Answer a batch of (start, finish) queries, computing each distinct pair only once.
+        Return the path of each query, or the exception it raised.
+        """
+        paths = {}
+        for query in queries:
+            if query not in paths:
+                try:
+                    paths[query] = self.path(*query)
+                except Exception as error:  # Only this query fails
+                    paths[query] = error
+        return [paths[query] for query in queries]
+
+    def image(self, path, scale=1, mode="RGB"):
+        """
+        Get the PNG bytes of the maze with the path drawn on it.
+        """
+        indices = self.indices.copy()
+        if path:
+            rows, columns = zip(*path)
+            indices[list(rows), list(columns)] = palette_index[ord('o')]
+        output = io.BytesIO()
+        indices_image(indices, scale, mode).save(output, format="PNG")
+        return output.getvalue()
+
+
+class MazeService:
+    def __init__(self):
+        """
+        Serve generate/load/solve requests on resident mazes, one JSON object per line each way.
+        """
+        self.mazes = {}  # Maze name -> ResidentMaze
+        self.names = itertools.count(1)
+        self.generator = ThreadPoolExecutor(max_workers=1)  # Generators share the random module, one at a time
+        self.workers = ThreadPoolExecutor()  # Loading, indexing, solve batches and images, off the event loop
+
+    async def handle_client(self, reader, writer):
+        """
+        Read the requests of a connection, so that a client can send many without waiting for the responses.
+        Solve requests run concurrently and are answered as soon as they are done (responses carry the request id),
+        any other request waits for the previous ones and runs before the next ones.
+        """
+        tasks = set()
+        while line := await reader.readline():
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                await self.answer({'op': None}, writer, error)
+                continue
+            if isinstance(request, dict) and request.get('op') == 'solve':
+                task = asyncio.create_task(self.answer(request, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                continue
+            if tasks:
+                await asyncio.wait(tasks)
+            await self.answer(request, writer)
+        if tasks:
+            await asyncio.wait(tasks)
+        writer.close()
+
+    async def answer(self, request, writer, error=None):
+        """
+        Handle one request and write its response line, or the error that prevented reading it.
+        """
+        try:
+            if error is not None:
+                raise error
+            response = await self.handle(request)
+        except Exception as error:  # Every request gets a response, the service keeps running
+            response = {'error': f"{type(error).__name__}: {error}"}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        writer.write(json.dumps(response).encode() + b'\n')
+        await writer.drain()
+
+    async def handle(self, request):
+        """
+        Run a request and return its response.
+        """
+        operation = request['op']
+        if operation == 'generate':
+            algorithm, size = request.get('algorithm', 'kruskal'), int(request['size'])
+            if algorithm not in GENERATORS:
+                raise ValueError(f"Unknown generator {algorithm}, use one of {', '.join(GENERATORS)}")
+            maze = await asyncio.get_running_loop().run_in_executor(
+                self.generator, self.generate, algorithm, size, request.get('seed'))
+            return self.add(request.get('name'), maze)
+        if operation == 'load':
+            maze = await asyncio.get_running_loop().run_in_executor(self.workers, self.load, request['file'])
+            return self.add(request.get('name'), maze)
+        if operation == 'solve':
+            return await self.solve(request)
+        if operation == 'drop':
+            del self.mazes[request['maze']]
+            return {'maze': request['maze']}
+        if operation == 'list':
+            return {'mazes': {name: [maze.solver.rows, maze.solver.columns]
+                              for name, maze in self.mazes.items()}}
+        raise ValueError(f"Unknown operation {operation}")
+
+    def generate(self, algorithm, size, seed):
+        """
+        Generate a maze, with the given seed if any, and index it. Run in the generator thread.
+        """
+        if seed is not None:
+            random.seed(seed)
+        return ResidentMaze(generate_rows(algorithm, size))
+
+    def load(self, file):
+        """
+        Read a maze from a text or binary file and index it. Run in a worker thread.
+        """
+        solver = AStarSolver()
+        solver.get_maze(file)
+        rows = ["".join(row) for row in solver.board]
+        return ResidentMaze(rows, solver.start, solver.finish)
+
+    def add(self, name, maze):
+        """
+        Make a maze resident under a name (a new one by default) and describe it.
+        """
+        name = name or f"maze-{next(self.names)}"
+        self.mazes[name] = maze
+        return {'maze': name, 'rows': maze.solver.rows, 'columns': maze.solver.columns}
+
+    async def solve(self, request):
+        """
+        Queue a path query on a resident maze. Queries arriving together are answered in one batch.
+        The response holds the path length and the path as 'moves' (run-length, see moves.py), 'path' or 'png'.
+        """
+        maze = self.mazes[request['maze']]
+        start = tuple(request.get('start', maze.solver.start))
+        finish = tuple(request.get('finish', maze.solver.finish))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not maze.solving:  # Runs once the queries already received are queued
+            maze.solving = True
+            asyncio.create_task(self.solve_batches(maze))
+        maze.pending.append((start, finish, future))
+        path = await future
+        response = {'maze': request['maze'], 'length': None if path is None else len(path)}
+        output = request.get('format', 'moves')
+        if output == 'png':
+            png = await loop.run_in_executor(self.workers, maze.image, path, int(request.get('scale', 1)),
+                                             request.get('mode', 'RGB'))
+            response['png'] = base64.b64encode(png).decode()
+        elif output == 'path':
+            response['path'] = path
+        else:
+            response['moves'] = None if path is None else encode_moves(path)
+        return response
+
+    async def solve_batches(self, maze):
+        """
+        Answer the pending queries of a maze in batches run in a worker thread, until none are left.
+        """
+        try:
+            while maze.pending:
+                pending, maze.pending = maze.pending, []
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.workers, maze.solve_batch, [(start, finish) for start, finish, _ in pending])
+                for (_, _, future), result in zip(pending, results):
+                    if future.cancelled():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            maze.solving = False
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, unix_path=None):
+    """
+    Run the maze service on a localhost TCP port, or on a Unix socket when unix_path is given.
+    """
+    service = MazeService()
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle_client, path=unix_path)
+    else:
+        server = await asyncio.start_server(service.handle_client, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def request(messages, host='127.0.0.1', port=DEFAULT_PORT, unix_path=None):
+    """
+    Send requests (dicts) to a running service over one connection and return the responses in the same order.
+    """
+    if unix_path:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(unix_path)
+    else:
+        connection = socket.create_connection((host, port))
+    with connection, connection.makefile('rwb') as stream:
+        for number, message in enumerate(messages):
+            stream.write(json.dumps({**message, 'id': number}).encode() + b'\n')
+        stream.flush()
+        connection.shutdown(socket.SHUT_WR)
+        responses = [json.loads(line) for line in stream]
+    return sorted(responses, key=lambda response: response['id'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep mazes in memory and answer generate/solve requests.")
+    parser.add_argument("--host", default='127.0.0.1', help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.unix))
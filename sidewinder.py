@@ -0,0 +1,32 @@
+import random
+import numpy as np
+from maze_core import GridMaze
+from grid_bands import band_rows, carve_rows
+
+
+class Maze(GridMaze):
+    def sidewinder(self, seed=None):
+        """
+        Generate the maze using the sidewinder algorithm: each row is cut at random into runs of cells joined
+        to the east, and every run opens the south passage of one of its cells. The last row is a single run.
+        Bands of rows are drawn at once from a numpy.random.Generator seeded with seed (drawn from random if None).
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed  # Stored in the binary maze file
+        rng = np.random.default_rng(self.seed)
+        n, height = self.n, self.height
+        step = band_rows(n)
+        for first in range(0, height, step):
+            rows = min(step, height - first)
+            closed = rng.random((rows, n)) < 0.5  # Cells ending their run
+            closed[:, -1] = True  # Runs never go through the outer east wall, so they never span two rows
+            if first + rows == height:
+                closed[-1, :-1] = False
+            east = ~closed
+            south = np.zeros((rows, n), dtype=bool)
+            ends = np.flatnonzero(closed)
+            starts = np.concatenate(([0], ends[:-1] + 1))
+            chosen = starts + (rng.random(ends.size) * (ends - starts + 1)).astype(np.int64)  # One cell per run
+            south.ravel()[chosen] = True
+            if first + rows == height:
+                south[-1] = False
+            carve_rows(self.grid, first, east, south)
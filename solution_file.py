@@ -0,0 +1,68 @@
+import gzip
+from itertools import accumulate
+from moves import encode_moves, decode_moves, gaps
+from cache import mark_solution
+
+GZIP_MAGIC = b'\x1f\x8b'
+UNMARK = str.maketrans("o*", "..")  # Solved board characters back to the route of the maze
+
+
+def unsolved_rows(board):
+    """
+    Yield the rows of a solved board as strings of the original maze, without copying the board.
+    """
+    for row in board:
+        yield "".join(row).translate(UNMARK)
+
+
+def save_compact(file_path, board, start, path, dead_ends, compress=False):
+    """
+    Save a solved maze as the maze itself followed by the solution: the start, the path as run-length moves
+    and the flat indices of the dead ends, written as the gaps between them. The board may be the solved one, its marks are not written.
+    With compress, the file is written gzip-compressed.
+    """
+    opener = gzip.open if compress else open
+    with opener(file_path, 'wt') as output:
+        output.write("Maze:\n")
+        for row in unsolved_rows(board):
+            output.write(row + '\n')
+        output.write(f"\nStart: {start[0]} {start[1]}\n")
+        if path is not None:  # No moves line when the maze has no solution
+            output.write(f"Moves: {encode_moves(path)}\n")
+        output.write("Dead ends: " + " ".join(map(str, gaps(sorted(dead_ends)))) + "\n")
+
+
+def read_compact(file_path):
+    """
+    Read a compact solution, gzip-compressed or not.
+    Return a dict with the maze rows as strings, the start, the path (None without solution) and the dead ends.
+    """
+    with open(file_path, 'rb') as file:
+        compressed = file.read(2) == GZIP_MAGIC
+    with (gzip.open if compressed else open)(file_path, 'rt') as file:
+        if file.readline().rstrip('\n') != "Maze:":
+            raise ValueError(f"{file_path} is not a compact solution file")
+        rows = []
+        for line in file:
+            line = line.rstrip('\n')
+            if not line:
+                break
+            rows.append(line)
+        fields = dict(line.rstrip('\n').split(": ", 1) for line in file)
+    start = tuple(map(int, fields['Start'].split()))
+    return {
+        'maze': rows,
+        'start': start,
+        'path': decode_moves(start, fields['Moves']) if 'Moves' in fields else None,
+        'dead_ends': list(accumulate(int(gap) for gap in fields['Dead ends'].split())),
+    }
+
+
+def load_solved_board(file_path):
+    """
+    Rebuild the annotated board of a compact solution: path cells marked with 'o' and dead ends with '*'.
+    """
+    solution = read_compact(file_path)
+    board = [list(row) for row in solution['maze']]
+    mark_solution(board, solution['path'] or (), solution['dead_ends'])
+    return board
@@ -0,0 +1,61 @@
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class SolverStats:
+    def __init__(self):
+        """
+        Initialize the counters filled by the solvers and the timings filled by the pipeline stages.
+        """
+        self.expanded = 0  # Cells expanded by the search
+        self.heap_pushes = 0  # Cells added to the open set, A* only
+        self.heap_pops = 0  # Cells taken from the open set, A* only
+        self.stale_skipped = 0  # Heap entries skipped because their cell was already expanded
+        self.backtracks = 0  # Backtracking only
+        self.layers = 0  # Breadth-first layers, bitboard only
+        self.max_frontier = 0  # Largest open set (A*) or stack (backtracking)
+        self.timings = {}  # Seconds spent in each stage
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time the enclosed block and add it to the timing of the given stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def add(self, other):
+        """
+        Add the counters of another SolverStats, e.g. filled in another process, keeping the largest frontier.
+        """
+        for name, value in vars(other).items():
+            if name == 'max_frontier':
+                self.max_frontier = max(self.max_frontier, value)
+            elif name != 'timings':
+                setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self):
+        """
+        Get the counters and timings as a dictionary.
+        """
+        stats = dict(vars(self))
+        stats['timings'] = dict(self.timings)
+        return stats
+
+    def save_json(self, filename):
+        """
+        Save the counters and timings to a JSON file.
+        """
+        with open(filename, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+def stage(stats, name):
+    """
+    Time a stage into stats, or do nothing when stats is None.
+    """
+    return stats.stage(name) if stats is not None else nullcontext()
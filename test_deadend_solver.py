@@ -0,0 +1,32 @@
+import random
+import pytest
+from astar import Solver as AStarSolver
+from deadend_solver import Solver
+from kruskal import Maze
+
+LOOP = [".######",
+        "......#",
+        "#.#.#.#",
+        "#.....#",
+        "###.#.#",
+        "#......",
+        "######."]
+
+
+def test_perfect_maze_path_matches_astar():
+    random.seed(0)
+    maze = Maze("maze", 12)
+    maze.kruskal()
+    board = [list(row) for row in maze.print_maze().split("\n")]
+    solver = Solver()
+    solver.load_board([row[:] for row in board])
+    reference = AStarSolver()
+    reference.load_board([row[:] for row in board])
+    assert len(solver.dead_end_filling()) == len(reference.astar_solver())
+
+
+def test_maze_with_a_loop_is_rejected():
+    solver = Solver()
+    solver.load_board([list(row) for row in LOOP])
+    with pytest.raises(ValueError):
+        solver.dead_end_filling()
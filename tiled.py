@@ -0,0 +1,88 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from maze_core import GridMaze, EAST, SOUTH
+from backtracking import Maze as BacktrackingMaze
+from kruskal import Maze as KruskalMaze, DisjointSet
+
+TILE_GENERATORS = ('backtracking', 'kruskal')
+
+
+def generate_tile(task):
+    """
+    Generate one tile as a maze of its own and return its packed walls.
+    Run in a worker process, so everything it needs comes with the task.
+    """
+    algorithm, rows, columns, seed = task
+    random.seed(seed)
+    if algorithm == 'backtracking':
+        tile = BacktrackingMaze("tile", columns, rows)
+        tile.backtrack(tile.board[0][0])
+    else:
+        tile = KruskalMaze("tile", columns, rows)
+        tile.kruskal()
+    return bytes(tile.grid.bits)
+
+
+def tile_rows(bits, rows, columns):
+    """
+    Split the packed walls of a tile into one string of '0'/'1' wall bits per row of cells, least significant first.
+    """
+    line = 2 * columns
+    bit_string = format(int.from_bytes(bits, 'little'), f'0{len(bits) * 8}b')[::-1]
+    return [bit_string[x * line:(x + 1) * line] for x in range(rows)]
+
+
+class Maze(GridMaze):
+    def tiled(self, k, algorithm='backtracking', workers=None):
+        """
+        Generate the maze as k x k tiles in worker processes, then stitch the tiles together.
+        Every tile is a perfect maze, so joining the tiles along a spanning tree of the tile grid,
+        with exactly one opening per joined border, gives a perfect maze again.
+        """
+        if not 1 <= k <= min(self.n, self.height):
+            raise ValueError(f"Cannot split a {self.n}x{self.height} maze into {k}x{k} tiles")
+        row_bounds = [i * self.height // k for i in range(k + 1)]
+        column_bounds = [j * self.n // k for j in range(k + 1)]
+        # Tiles generated in this process reseed the random module, the stitching gets its own generator
+        stitching = random.Random(random.getrandbits(64))
+        tasks = [(algorithm, row_bounds[i + 1] - row_bounds[i], column_bounds[j + 1] - column_bounds[j],
+                  random.getrandbits(64)) for i in range(k) for j in range(k)]
+        workers = workers or os.cpu_count()
+        if workers == 1 or k == 1:
+            tiles = list(map(generate_tile, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                tiles = list(executor.map(generate_tile, tasks))
+
+        # Lay the tiles out as one bit string, row of cells by row of cells, and pack it back in one go
+        lines = []
+        for i in range(k):
+            band = [tile_rows(bits, task[1], task[2]) for bits, task in zip(tiles[i * k:(i + 1) * k], tasks[i * k:(i + 1) * k])]
+            lines.extend("".join(parts) for parts in zip(*band))
+        bit_string = "".join(lines)
+        self.grid.bits[:] = int(bit_string[::-1] or '0', 2).to_bytes(len(self.grid.bits), 'little')
+        self.stitch(k, row_bounds, column_bounds, stitching)
+
+    def stitch(self, k, row_bounds, column_bounds, rng=random):
+        """
+        Open one wall at a random place of the borders between tiles, in random order,
+        keeping only those joining two tiles that are not connected yet (k*k - 1 of them).
+        """
+        borders = [(i * k + j, EAST) for i in range(k) for j in range(k - 1)]
+        borders += [(i * k + j, SOUTH) for i in range(k - 1) for j in range(k)]
+        rng.shuffle(borders)
+        tiles = DisjointSet(k * k)
+        merges = 0
+        for tile, wall in borders:
+            if merges == k * k - 1:
+                break
+            i, j = divmod(tile, k)
+            if not tiles.union(tile, tile + (1 if wall == EAST else k)):
+                continue
+            if wall == EAST:  # Last column of the tile, any of its rows
+                x, y = rng.randrange(row_bounds[i], row_bounds[i + 1]), column_bounds[j + 1] - 1
+            else:  # Last row of the tile, any of its columns
+                x, y = row_bounds[i + 1] - 1, rng.randrange(column_bounds[j], column_bounds[j + 1])
+            self.grid.carve(x * self.n + y, wall)
+            merges += 1
@@ -0,0 +1,124 @@
+from array import array
+
+
+class TreeIndex:
+    def __init__(self, solver):
+        """
+        Index the open cells of a perfect maze loaded in an astar.Solver as a tree rooted at the start.
+        Every node stores its parent, its depth and one jump pointer to an ancestor, chosen so that
+        jumps have binary lengths (skew-binary lifting): any ancestor, and so the lowest common ancestor
+        of two cells, is reached in O(log n) steps with O(1) memory per cell.
+        """
+        self.solver = solver
+        size = len(solver.open_cells)
+        self.node_of = array('i', [-1]) * size  # Node number of each flat grid index, -1 for walls
+        self.cell = array('i')  # Flat grid index of each node, nodes are numbered in breadth-first order
+        self.parent = array('i')
+        self.jump = array('i')
+        self.depth = array('i')
+        self.build(solver.index(solver.start))
+
+    def build(self, root):
+        """
+        Walk the maze breadth-first from the root, adding every cell as a leaf of its parent.
+        """
+        open_cells, offsets = self.solver.open_cells, self.solver.offsets
+        node_of, cell, parent, jump, depth = self.node_of, self.cell, self.parent, self.jump, self.depth
+        node_of[root] = 0
+        cell.append(root)
+        parent.append(0)
+        jump.append(0)
+        depth.append(0)
+        node = 0
+        while node < len(cell):
+            current = cell[node]
+            for offset in offsets:
+                neighbor = current + offset
+                if not open_cells[neighbor] or neighbor == cell[parent[node]]:
+                    continue
+                if node_of[neighbor] != -1:
+                    raise ValueError("The maze has a loop, it is not a perfect maze")
+                child = len(cell)
+                node_of[neighbor] = child
+                cell.append(neighbor)
+                parent.append(node)
+                depth.append(depth[node] + 1)
+                # Jump twice as far as the parent when its two previous jumps have the same length
+                up = jump[node]
+                if depth[node] - depth[up] == depth[up] - depth[jump[up]]:
+                    jump.append(jump[up])
+                else:
+                    jump.append(node)
+            node += 1
+
+    def node(self, position):
+        """
+        Get the node number of a (x, y) board position.
+        """
+        x, y = position
+        if not (0 <= x < self.solver.rows and 0 <= y < self.solver.columns):
+            raise ValueError(f"{position} is outside the maze")
+        node = self.node_of[self.solver.index(position)]
+        if node == -1:
+            raise ValueError(f"{position} is a wall or cannot be reached from the start")
+        return node
+
+    def ancestor(self, node, target_depth):
+        """
+        Get the ancestor of a node at the given depth.
+        """
+        depth, jump, parent = self.depth, self.jump, self.parent
+        while depth[node] > target_depth:
+            node = jump[node] if depth[jump[node]] >= target_depth else parent[node]
+        return node
+
+    def lowest_common_ancestor(self, first, second):
+        """
+        Get the lowest common ancestor of two nodes.
+        """
+        depth, jump, parent = self.depth, self.jump, self.parent
+        if depth[first] < depth[second]:
+            first, second = second, first
+        first = self.ancestor(first, depth[second])
+        while first != second:
+            if jump[first] != jump[second]:  # Both jumps stay below the common ancestor
+                first, second = jump[first], jump[second]
+            else:
+                first, second = parent[first], parent[second]
+        return first
+
+    def distance(self, start, goal):
+        """
+        Get the length of the path between two board positions.
+        """
+        first, second = self.node(start), self.node(goal)
+        common = self.lowest_common_ancestor(first, second)
+        return self.depth[first] + self.depth[second] - 2 * self.depth[common]
+
+    def path(self, start, goal):
+        """
+        Get the path between two board positions as a list of (x, y) positions, start and goal included.
+        """
+        first, second = self.node(start), self.node(goal)
+        common = self.lowest_common_ancestor(first, second)
+        up, down = [], []
+        while first != common:
+            up.append(first)
+            first = self.parent[first]
+        while second != common:
+            down.append(second)
+            second = self.parent[second]
+        nodes = up + [common] + down[::-1]
+        return [self.solver.position(self.cell[node]) for node in nodes]
+
+    def distances(self, queries):
+        """
+        Get the path length of every (start, goal) pair.
+        """
+        return [self.distance(start, goal) for start, goal in queries]
+
+    def paths(self, queries):
+        """
+        Get the path of every (start, goal) pair.
+        """
+        return [self.path(start, goal) for start, goal in queries]
@@ -0,0 +1,51 @@
+import random
+import numpy as np
+from maze_core import GridMaze, EAST, SOUTH
+
+BATCH = 1 << 16  # Random directions drawn at once
+
+
+class Maze(GridMaze):
+    def wilson(self, seed=None):
+        """
+        Generate the maze using Wilson's algorithm, which gives every spanning tree the same probability.
+        From each cell not in the maze yet, a random walk runs until it reaches the maze, and the walk
+        with its loops erased is added to the maze. Only the last direction taken from each cell is kept,
+        so following them from the first cell of the walk skips the loops.
+        Directions are drawn in batches from a numpy.random.Generator seeded with seed (drawn from random if None).
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed  # Stored in the binary maze file
+        rng = np.random.default_rng(self.seed)
+        n, cells = self.n, self.n * self.height
+        carve = self.grid.carve
+        in_maze = bytearray(cells)
+        in_maze[int(rng.integers(cells))] = 1
+        exits = bytearray(cells)  # Last direction taken from each cell of the current walk
+        steps = (-n, n, -1, 1)  # North, south, west, east
+        directions, used = rng.integers(0, 4, BATCH, dtype=np.uint8).tobytes(), 0
+        for first in range(cells):
+            current = first
+            while not in_maze[current]:  # Random walk until the maze is reached
+                if used == BATCH:
+                    directions, used = rng.integers(0, 4, BATCH, dtype=np.uint8).tobytes(), 0
+                direction = directions[used]
+                used += 1
+                if ((direction == 0 and current < n) or (direction == 1 and current >= cells - n)
+                        or (direction == 2 and current % n == 0) or (direction == 3 and current % n == n - 1)):
+                    continue  # Outer wall, draw again
+                exits[current] = direction
+                current += steps[direction]
+            current = first
+            while not in_maze[current]:  # Add the loop-erased walk to the maze
+                in_maze[current] = 1
+                direction = exits[current]
+                following = current + steps[direction]
+                if direction == 0:
+                    carve(following, SOUTH)
+                elif direction == 1:
+                    carve(current, SOUTH)
+                elif direction == 2:
+                    carve(following, EAST)
+                else:
+                    carve(current, EAST)
+                current = following